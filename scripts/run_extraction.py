@@ -3,15 +3,14 @@
 
 Example:
     python scripts/run_extraction.py --simulator sir --extractor ast
+
+Requires the package to be installed (``pip install -e .``).
 """
 
 import argparse
 import sys
 from pathlib import Path
 
-# Add src to path for development
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
-
 from scmextract.extractors import get_extractor
 from scmextract.simulators import get_simulator
 from scmextract.evaluation import evaluate_graph
@@ -56,13 +55,11 @@ def main():
     print()
 
     print(f"Predicted edges ({predicted.num_edges()}):")
-    for parent, child in predicted.get_edges():
-        print(f"  {parent} -> {child}")
+    sys.stdout.write("".join(f"  {parent} -> {child}\n" for parent, child in predicted.get_edges()))
 
     print()
     print(f"Ground truth edges ({ground_truth.num_edges()}):")
-    for parent, child in ground_truth.get_edges():
-        print(f"  {parent} -> {child}")
+    sys.stdout.write("".join(f"  {parent} -> {child}\n" for parent, child in ground_truth.get_edges()))
 
     # Save output
     if args.output:
@@ -1,10 +1,5 @@
 """SCM Extract - Extract Structural Causal Models from simulator code."""
 
-from scmextract.core.types import CausalGraph, ExperimentConfig
-from scmextract.core.base import BaseSimulator, BaseExtractor
-from scmextract.extractors.ast_extractor import ASTExtractor
-from scmextract.simulators.sir import SIRSimulator
-
 __version__ = "0.1.0"
 
 __all__ = [
@@ -15,3 +10,28 @@ __all__ = [
     "ASTExtractor",
     "SIRSimulator",
 ]
+
+# Public names are imported on first access (PEP 562) so that importing the
+# package, e.g. for the CLI, doesn't pay for numpy/pandas up front.
+_LAZY_IMPORTS = {
+    "CausalGraph": "scmextract.core.types",
+    "ExperimentConfig": "scmextract.core.types",
+    "BaseSimulator": "scmextract.core.base",
+    "BaseExtractor": "scmextract.core.base",
+    "ASTExtractor": "scmextract.extractors.ast_extractor",
+    "SIRSimulator": "scmextract.simulators.sir",
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_IMPORTS:
+        import importlib
+
+        value = getattr(importlib.import_module(_LAZY_IMPORTS[name]), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
@@ -0,0 +1,257 @@
+"""Benchmark extraction methods across simulators.
+
+Example:
+    scmextract-benchmark --output results/benchmark
+"""
+
+import argparse
+import csv
+import itertools
+import json
+import logging
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import ExitStack
+from datetime import datetime
+from functools import partial
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Set, Tuple, Type, Union
+
+from scmextract.core.base import BaseExtractor
+from scmextract.core.context import ExtractionContext
+from scmextract.core.io import dump_json, ensure_dir
+from scmextract.core.types import CausalGraph
+from scmextract.evaluation.metrics import evaluate_graph
+from scmextract.extractors.registry import ExtractorRegistry
+from scmextract.simulators.registry import SimulatorRegistry, get_simulator
+from scmextract.visualization.graph_viz import save_graph, visualize_graph
+
+logger = logging.getLogger(__name__)
+
+# Columns of summary.csv, in order
+FIELDNAMES = [
+    "simulator",
+    "extractor",
+    "precision",
+    "recall",
+    "f1",
+    "shd",
+    "num_predicted_edges",
+    "num_true_edges",
+]
+
+# Above these sizes, summary.json and predicted.json are written as
+# compact gzip-compressed JSON (summary.json.gz, predicted.json.gz)
+SUMMARY_GZIP_MIN_ROWS = 100
+GRAPH_GZIP_MIN_EDGES = 1000
+
+# Per-process cache of (ground_truth, variables, context) keyed by simulator name
+_SIM_CACHE: Dict[str, tuple] = {}
+
+
+def _init_worker(sim_cache: Dict[str, tuple]) -> None:
+    """Install the shared simulator cache in a worker process."""
+    global _SIM_CACHE
+    _SIM_CACHE = sim_cache
+
+
+def _run_pair(task: Tuple[str, str, Type[BaseExtractor]],
+              use_cache: bool = True) -> Tuple[dict, CausalGraph]:
+    """Run one extractor on one simulator and evaluate the result.
+
+    Args:
+        task: (simulator name, extractor name, extractor class). The class is
+            passed rather than looked up by name, so extractors registered at
+            runtime also work in spawned worker processes.
+        use_cache: Whether to reuse cached extraction results.
+
+    Returns:
+        Tuple of (result row with the evaluation metrics, predicted graph).
+    """
+    sim_name, ext_name, extractor_cls = task
+    ground_truth, variables, context = _SIM_CACHE[sim_name]
+
+    extractor = extractor_cls()
+    if use_cache:
+        predicted = extractor.cached_extract(context.source_path, variables=variables,
+                                             context=context)
+    else:
+        predicted = extractor._extract(context.source_path, variables, context)
+    metrics = evaluate_graph(predicted, ground_truth)
+
+    row = {
+        "simulator": sim_name,
+        "extractor": ext_name,
+        "precision": metrics["precision"],
+        "recall": metrics["recall"],
+        "f1": metrics["f1"],
+        "shd": metrics["shd"],
+        "num_predicted_edges": predicted.num_edges(),
+        "num_true_edges": ground_truth.num_edges(),
+    }
+    return row, predicted
+
+
+def run_benchmark(
+    extractor_names: List[str],
+    simulator_names: List[str],
+    output_path: Union[str, Path],
+    use_cache: bool = True,
+) -> List[dict]:
+    """Run every extractor on every simulator and save the results.
+
+    Each (simulator, extractor) pair runs in its own worker process, or in
+    this process when there is only one pair or one CPU. The predicted graph and its visualization are saved under
+    ``output_path/<simulator>/<extractor>/``. Result rows are appended to
+    ``summary.csv`` and ``summary.jsonl`` as each pair finishes, so partial
+    results survive an interrupted run; ``summary.json`` is written at the end.
+    Summaries of more than ``SUMMARY_GZIP_MIN_ROWS`` rows, and graphs with
+    more than ``GRAPH_GZIP_MIN_EDGES`` edges, are saved gzip-compressed with a
+    ``.json.gz`` suffix instead.
+    Progress is reported through the ``scmextract.benchmark`` logger, one
+    INFO record per finished pair.
+
+    Args:
+        extractor_names: Extractors to benchmark.
+        simulator_names: Simulators to benchmark.
+        output_path: Output directory.
+        use_cache: Whether to reuse cached extraction results.
+
+    Returns:
+        List of result rows, one per pair, in (simulator, extractor) order.
+
+    Raises:
+        KeyError: If an extractor or simulator name isn't registered. Nothing
+            is written in that case.
+    """
+    # Resolve every name before creating any output, so an unknown name fails
+    # cleanly; workers get the classes, not names to look up in their registry
+    extractor_classes = {name: ExtractorRegistry.get(name) for name in extractor_names}
+
+    # Build simulator info and parse its source once, then share it with every worker
+    sim_cache = {}
+    for sim_name in simulator_names:
+        simulator = get_simulator(sim_name)
+        sim_cache[sim_name] = (
+            simulator.get_ground_truth_graph(),
+            # In ground truth order, so the predicted graph lines up with it
+            tuple(simulator.get_all_variables()),
+            ExtractionContext.from_path(simulator.get_source_path()),
+        )
+
+    tasks = [(sim_name, ext_name, extractor_classes[ext_name])
+             for sim_name, ext_name in itertools.product(simulator_names, extractor_names)]
+
+    # Directories created during this run; never shared between runs, so a
+    # deleted output directory is recreated by the next call
+    created_dirs: Set[Path] = set()
+    output_path = ensure_dir(output_path, created_dirs)
+    if not tasks:
+        return []
+
+    max_workers = min(len(tasks), os.cpu_count() or 1)
+    results = []
+    io_futures = []
+
+    # Saving and rendering run on background threads, overlapping with extraction
+    with ExitStack() as stack:
+        csv_file = stack.enter_context(open(output_path / "summary.csv", "w", newline=""))
+        jsonl_file = stack.enter_context(open(output_path / "summary.jsonl", "w"))
+        io_pool = stack.enter_context(ThreadPoolExecutor(max_workers=4))
+
+        run_pair = partial(_run_pair, use_cache=use_cache)
+        if max_workers == 1:
+            # A single pair (or CPU) gains nothing from a process pool but its startup
+            _init_worker(sim_cache)
+            stack.callback(_init_worker, {})
+            pair_results = map(run_pair, tasks)
+        else:
+            executor = stack.enter_context(ProcessPoolExecutor(
+                max_workers=max_workers, initializer=_init_worker, initargs=(sim_cache,)))
+            pair_results = executor.map(run_pair, tasks)
+
+        writer = csv.DictWriter(csv_file, fieldnames=FIELDNAMES)
+        writer.writeheader()
+
+        for row, predicted in pair_results:
+            sim_name, ext_name = row["simulator"], row["extractor"]
+            logger.info("  %s + %s... F1=%.3f, SHD=%d", sim_name, ext_name, row["f1"], row["shd"])
+            results.append(row)
+
+            # Stream the row to disk
+            writer.writerow(row)
+            jsonl_file.write(json.dumps(row) + "\n")
+            for f in (csv_file, jsonl_file):
+                f.flush()
+                os.fsync(f.fileno())
+
+            # Save individual results
+            result_dir = ensure_dir(output_path / sim_name / ext_name, created_dirs)
+            graph_name = ("predicted.json.gz" if predicted.num_edges() > GRAPH_GZIP_MIN_EDGES
+                          else "predicted.json")
+            io_futures.append(io_pool.submit(
+                save_graph, predicted, result_dir / graph_name, format="json"))
+            io_futures.append(io_pool.submit(
+                visualize_graph, predicted, output_path=str(result_dir / "predicted.png"),
+                title=f"{sim_name} - {ext_name}"))
+
+    # Surface any errors from the background writes
+    for future in io_futures:
+        future.result()
+
+    # Save summary JSON
+    summary = {
+        "timestamp": datetime.now().isoformat(),
+        "extractors": extractor_names,
+        "simulators": simulator_names,
+        "results": results,
+    }
+    summary_name = "summary.json.gz" if len(results) > SUMMARY_GZIP_MIN_ROWS else "summary.json"
+    dump_json(summary, output_path / summary_name)
+
+    return results
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    """Command-line entry point for ``scmextract-benchmark``.
+
+    Args:
+        argv: Command-line arguments. Defaults to ``sys.argv[1:]``.
+    """
+    parser = argparse.ArgumentParser(description="Run benchmark across simulators and extractors")
+    parser.add_argument("--output", "-o", default="results/benchmark", help="Output directory")
+    parser.add_argument("--extractors", "-e", nargs="+", help="Specific extractors to run")
+    parser.add_argument("--simulators", "-s", nargs="+", help="Specific simulators to run")
+    parser.add_argument("--no-cache", action="store_true", help="Ignore cached extraction results")
+    args = parser.parse_args(argv)
+
+    # Get extractors and simulators
+    extractor_names = args.extractors or list(ExtractorRegistry.list_extractors().keys())
+    simulator_names = args.simulators or list(SimulatorRegistry.list_simulators().keys())
+
+    print(f"Benchmarking {len(extractor_names)} extractor(s) on {len(simulator_names)} simulator(s)")
+    print(f"  Extractors: {', '.join(extractor_names)}")
+    print(f"  Simulators: {', '.join(simulator_names)}")
+    print()
+
+    # Per-pair progress is logged by run_benchmark
+    logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stdout)
+
+    output_path = Path(args.output)
+    results = run_benchmark(extractor_names, simulator_names, output_path,
+                            use_cache=not args.no_cache)
+
+    print(f"\nBenchmark complete. Results saved to: {output_path}")
+
+    # Print summary table
+    print("\n" + "=" * 60)
+    print(f"{'Simulator':<15} {'Extractor':<12} {'Precision':>10} {'Recall':>10} {'F1':>10} {'SHD':>6}")
+    print("-" * 60)
+    for r in results:
+        print(f"{r['simulator']:<15} {r['extractor']:<12} {r['precision']:>10.3f} {r['recall']:>10.3f} {r['f1']:>10.3f} {r['shd']:>6}")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
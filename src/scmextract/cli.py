@@ -1,16 +1,22 @@
 """Command-line interface for SCM extraction."""
 
-import json
 from pathlib import Path
 from typing import Optional
 
 import click
 
-from scmextract.core.config import load_config
 from scmextract.extractors.registry import ExtractorRegistry, get_extractor
 from scmextract.simulators.registry import SimulatorRegistry, get_simulator
-from scmextract.evaluation.metrics import evaluate_graph
-from scmextract.visualization.graph_viz import save_graph, visualize_graph
+# Evaluation, visualization and config loading pull in pandas, matplotlib
+# and yaml; they are imported inside the commands that need them so that
+# --help and the list-* commands start quickly.
+
+
+def _extract(extractor, source_path, variables, use_cache: bool):
+    """Run an extractor, going through the on-disk cache unless disabled."""
+    if use_cache:
+        return extractor.cached_extract(source_path, variables=variables)
+    return extractor.extract(source_path, variables=variables)
 
 
 @click.group()
@@ -26,17 +32,22 @@ def cli():
 @click.option("--variables", "-v", multiple=True, help="Variables to extract (can specify multiple)")
 @click.option("--output", "-o", type=click.Path(), help="Output file (JSON, DOT, or PNG based on extension)")
 @click.option("--quiet", "-q", is_flag=True, help="Suppress output except errors")
-def extract(source_file: str, method: str, variables: tuple, output: Optional[str], quiet: bool):
+@click.option("--no-cache", is_flag=True, help="Ignore cached extraction results")
+def extract(source_file: str, method: str, variables: tuple, output: Optional[str], quiet: bool,
+            no_cache: bool):
     """Extract causal graph from a Python source file.
 
     Example:
         scmextract extract model.py --method ast -v S -v I -v R -o graph.json
     """
+    from scmextract.visualization.graph_viz import save_graph
+
     source_path = Path(source_file)
-    var_set = set(variables) if variables else None
+    # Drop repeated -v names, keeping the first occurrence's position
+    var_list = list(dict.fromkeys(variables)) if variables else None
 
     extractor = get_extractor(method)
-    graph = extractor.extract(source_path, variables=var_set)
+    graph = _extract(extractor, source_path, var_list, use_cache=not no_cache)
 
     if output:
         output_path = Path(output)
@@ -57,23 +68,31 @@ def extract(source_file: str, method: str, variables: tuple, output: Optional[st
             click.echo("\nExtracted Causal Graph:")
             click.echo(f"  Variables: {graph.variables}")
             click.echo(f"  Edges ({graph.num_edges()}):")
-            for parent, child in graph.get_edges():
-                click.echo(f"    {parent} -> {child}")
+            if graph.num_edges():
+                click.echo("\n".join(f"    {parent} -> {child}" for parent, child in graph.get_edges()))
 
 
 @cli.command()
 @click.argument("config_file", type=click.Path(exists=True))
 @click.option("--output-dir", "-o", type=click.Path(), help="Override output directory")
-def run(config_file: str, output_dir: Optional[str]):
+@click.option("--no-cache", is_flag=True, help="Ignore cached extraction results")
+def run(config_file: str, output_dir: Optional[str], no_cache: bool):
     """Run an extraction experiment from a YAML config file.
 
     Example:
         scmextract run configs/experiments/sir_basic.yaml
     """
+    import dataclasses
+
+    from scmextract.core.config import load_config
+    from scmextract.core.io import dump_json
+    from scmextract.evaluation.metrics import evaluate_graph
+    from scmextract.visualization.graph_viz import save_graph, visualize_graph
+
     config = load_config(config_file)
 
     if output_dir:
-        config.output_dir = output_dir
+        config = dataclasses.replace(config, output_dir=output_dir)
 
     click.echo(f"Running experiment: {config.name}")
 
@@ -82,7 +101,7 @@ def run(config_file: str, output_dir: Optional[str]):
     extractor = get_extractor(config.extractor)
 
     # Determine variables
-    variables = set(config.variables) if config.variables else set(simulator.get_all_variables())
+    variables = list(dict.fromkeys(config.variables or simulator.get_all_variables()))
 
     click.echo(f"  Simulator: {config.simulator}")
     click.echo(f"  Extractor: {config.extractor}")
@@ -90,7 +109,7 @@ def run(config_file: str, output_dir: Optional[str]):
 
     # Extract
     source_path = simulator.get_source_path()
-    predicted = extractor.extract(source_path, variables=variables)
+    predicted = _extract(extractor, source_path, variables, use_cache=not no_cache)
 
     # Get ground truth and evaluate
     ground_truth = simulator.get_ground_truth_graph()
@@ -107,9 +126,7 @@ def run(config_file: str, output_dir: Optional[str]):
     output_path.mkdir(parents=True, exist_ok=True)
 
     # Save metrics
-    metrics_file = output_path / "metrics.json"
-    with open(metrics_file, "w") as f:
-        json.dump(metrics, f, indent=2)
+    dump_json(metrics, output_path / "metrics.json")
 
     # Save predicted graph
     save_graph(predicted, output_path / "predicted.json", format="json")
@@ -154,14 +171,17 @@ def list_extractors():
 @click.option("--methods", "-m", multiple=True, help="Extraction methods to benchmark (default: all)")
 @click.option("--simulators", "-s", multiple=True, help="Simulators to benchmark (default: all)")
 @click.option("--output", "-o", default="results/benchmark", help="Output directory")
-def benchmark(methods: tuple, simulators: tuple, output: str):
+@click.option("--no-cache", is_flag=True, help="Ignore cached extraction results")
+def benchmark(methods: tuple, simulators: tuple, output: str, no_cache: bool):
     """Run benchmark across simulators and extraction methods.
 
     Example:
         scmextract benchmark --methods ast --output results/benchmark
     """
-    import csv
-    from datetime import datetime
+    import logging
+    import sys
+
+    from scmextract.benchmark import run_benchmark
 
     # Get all extractors and simulators if not specified
     extractor_names = list(methods) if methods else list(ExtractorRegistry.list_extractors().keys())
@@ -180,62 +200,11 @@ def benchmark(methods: tuple, simulators: tuple, output: str):
     click.echo(f"  Simulators: {', '.join(simulator_names)}")
     click.echo()
 
-    # Prepare output directory
-    output_path = Path(output)
-    output_path.mkdir(parents=True, exist_ok=True)
+    # Per-pair progress is logged by the benchmark runner
+    logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stdout)
 
-    # Collect results
-    results = []
-
-    for sim_name in simulator_names:
-        simulator = get_simulator(sim_name)
-        ground_truth = simulator.get_ground_truth_graph()
-        variables = set(simulator.get_all_variables())
-        source_path = simulator.get_source_path()
-
-        for ext_name in extractor_names:
-            click.echo(f"  {sim_name} + {ext_name}...", nl=False)
-
-            extractor = get_extractor(ext_name)
-            predicted = extractor.extract(source_path, variables=variables)
-            metrics = evaluate_graph(predicted, ground_truth)
-
-            results.append({
-                "simulator": sim_name,
-                "extractor": ext_name,
-                "precision": metrics["precision"],
-                "recall": metrics["recall"],
-                "f1": metrics["f1"],
-                "shd": metrics["shd"],
-                "num_predicted_edges": predicted.num_edges(),
-                "num_true_edges": ground_truth.num_edges(),
-            })
-
-            click.echo(f" F1={metrics['f1']:.3f}, SHD={metrics['shd']}")
-
-            # Save individual results
-            result_dir = output_path / sim_name / ext_name
-            result_dir.mkdir(parents=True, exist_ok=True)
-            save_graph(predicted, result_dir / "predicted.json", format="json")
-            visualize_graph(predicted, output_path=str(result_dir / "predicted.png"),
-                          title=f"{sim_name} - {ext_name}")
-
-    # Save summary CSV
-    csv_path = output_path / "summary.csv"
-    with open(csv_path, "w", newline="") as f:
-        writer = csv.DictWriter(f, fieldnames=results[0].keys())
-        writer.writeheader()
-        writer.writerows(results)
-
-    # Save summary JSON
-    summary = {
-        "timestamp": datetime.now().isoformat(),
-        "extractors": extractor_names,
-        "simulators": simulator_names,
-        "results": results,
-    }
-    with open(output_path / "summary.json", "w") as f:
-        json.dump(summary, f, indent=2)
+    output_path = Path(output)
+    run_benchmark(extractor_names, simulator_names, output_path, use_cache=not no_cache)
 
     click.echo(f"\nBenchmark complete. Results saved to: {output_path}")
 
@@ -2,7 +2,7 @@
 
 from scmextract.core.types import CausalGraph, ExperimentConfig
 from scmextract.core.base import BaseSimulator, BaseExtractor
-from scmextract.core.config import load_config
+from scmextract.core.context import ExtractionContext
 
 __all__ = [
     "CausalGraph",
@@ -10,4 +10,20 @@ __all__ = [
     "BaseSimulator",
     "BaseExtractor",
     "load_config",
+    "ExtractionContext",
 ]
+
+
+# load_config pulls in yaml, so it is imported on first access (PEP 562);
+# the CLI imports this package on every start.
+def __getattr__(name):
+    if name == "load_config":
+        from scmextract.core.config import load_config
+
+        globals()[name] = load_config
+        return load_config
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
@@ -1,13 +1,49 @@
 """Abstract base classes for simulators and extractors."""
 
+from __future__ import annotations
+
+import functools
+import hashlib
+import inspect
 from abc import ABC, abstractmethod
+from collections.abc import Set as AbstractSet
 from pathlib import Path
-from typing import List, Optional, Set
-
-import pandas as pd
+from typing import TYPE_CHECKING, Collection, List, Optional, Union
 
+from scmextract.core.cache import get_cache_dir, load_cached, store_cached
+from scmextract.core.context import ExtractionContext
 from scmextract.core.types import CausalGraph
 
+if TYPE_CHECKING:
+    import pandas as pd
+
+
+@functools.lru_cache(maxsize=None)
+def _accepts_context(extractor_cls: type) -> bool:
+    """Return whether an extractor class's ``extract`` takes a ``context`` argument.
+
+    Extractors written before ``context`` was added only accept
+    ``source_path`` and ``variables``.
+    """
+    parameters = inspect.signature(extractor_cls.extract).parameters.values()
+    return any(p.name == "context" or p.kind is inspect.Parameter.VAR_KEYWORD
+               for p in parameters)
+
+
+@functools.lru_cache(maxsize=None)
+def _class_source_digest(cls: type) -> str:
+    """Return a short hash of the source file that defines ``cls``.
+
+    Returns an empty string when the source isn't available, e.g. for
+    classes defined interactively.
+    """
+    try:
+        source_file = inspect.getsourcefile(cls)
+        source = Path(source_file).read_bytes() if source_file else b""
+    except (TypeError, OSError):
+        return ""
+    return hashlib.sha256(source).hexdigest()[:16] if source else ""
+
 
 class BaseSimulator(ABC):
     """Abstract base class for simulators with known causal structure.
@@ -81,14 +117,24 @@ class BaseExtractor(ABC):
 
     name: str = "base"
 
+    # Bump when extraction logic outside the extractor's own module changes,
+    # to invalidate cached results (edits to the module itself are detected)
+    VERSION: str = "0"
+
     @abstractmethod
-    def extract(self, source_path: Path, variables: Optional[Set[str]] = None) -> CausalGraph:
+    def extract(self, source_path: Path, variables: Optional[Collection[str]] = None,
+                context: Optional[ExtractionContext] = None) -> CausalGraph:
         """Extract causal graph from source code.
 
         Args:
             source_path: Path to the Python source file.
-            variables: Optional set of variables to focus on.
+            variables: Optional variables to focus on. A sequence fixes the
+                      variable order of the graph; a set is sorted.
                       If None, extract all detected relationships.
+            context: Optional pre-read and pre-parsed ``source_path``.
+                     Extractors should use it instead of reading the file
+                     when given. Extractors that don't declare it are
+                     still supported; callers then only pass the path.
 
         Returns:
             CausalGraph representing the extracted causal structure.
@@ -96,12 +142,12 @@ class BaseExtractor(ABC):
         pass
 
     def extract_from_string(self, source_code: str,
-                           variables: Optional[Set[str]] = None) -> CausalGraph:
+                           variables: Optional[Collection[str]] = None) -> CausalGraph:
         """Extract causal graph from source code string.
 
         Args:
             source_code: Python source code as string.
-            variables: Optional set of variables to focus on.
+            variables: Optional variables to focus on (see :meth:`extract`).
 
         Returns:
             CausalGraph representing the extracted causal structure.
@@ -109,3 +155,66 @@ class BaseExtractor(ABC):
         raise NotImplementedError(
             f"{self.__class__.__name__} does not support extraction from string"
         )
+
+    def cache_token(self) -> str:
+        """Return a string identifying this extractor and its configuration.
+
+        Used as part of the cache key in :meth:`cached_extract`. The default
+        combines the class name, ``VERSION``, a hash of the module source
+        defining the class and the instance attributes, so editing that
+        module invalidates cached results. Bump ``VERSION`` when extraction
+        logic outside the module changes. Override if the attributes don't
+        have a stable ``repr``.
+
+        Returns:
+            Configuration token.
+        """
+        cls = type(self)
+        params = sorted(vars(self).items())
+        return f"{cls.__qualname__}:{self.VERSION}:{_class_source_digest(cls)}:{params!r}"
+
+    def cached_extract(self, source_path: Path, variables: Optional[Collection[str]] = None,
+                       cache_dir: Optional[Union[str, Path]] = None,
+                       context: Optional[ExtractionContext] = None) -> CausalGraph:
+        """Extract causal graph, reusing a cached result when available.
+
+        Results are cached on disk, keyed by the source file contents, the
+        variables and :meth:`cache_token`.
+
+        Args:
+            source_path: Path to the Python source file.
+            variables: Optional variables to focus on (see :meth:`extract`).
+            cache_dir: Cache directory. Defaults to :func:`get_cache_dir`.
+            context: Optional pre-read and pre-parsed ``source_path``.
+
+        Returns:
+            CausalGraph representing the extracted causal structure.
+        """
+        source_path = Path(source_path)
+        cache_dir = Path(cache_dir) if cache_dir is not None else get_cache_dir()
+
+        source_bytes = context.source_bytes if context else source_path.read_bytes()
+        digest = hashlib.sha256(source_bytes)
+        # Sets are order-free, but a sequence's order determines the graph
+        if isinstance(variables, AbstractSet):
+            variables_key = sorted(variables)
+        else:
+            variables_key = list(dict.fromkeys(variables or []))
+        digest.update(repr(variables_key).encode())
+        digest.update(self.cache_token().encode())
+        key = f"{self.__class__.__name__}-{digest.hexdigest()}"
+
+        graph = load_cached(cache_dir, key)
+        if isinstance(graph, CausalGraph):
+            return graph
+
+        graph = self._extract(source_path, variables, context)
+        store_cached(cache_dir, key, graph)
+        return graph
+
+    def _extract(self, source_path: Path, variables: Optional[Collection[str]],
+                 context: Optional[ExtractionContext]) -> CausalGraph:
+        """Call :meth:`extract`, passing ``context`` only if the extractor accepts it."""
+        if context is not None and _accepts_context(type(self)):
+            return self.extract(source_path, variables=variables, context=context)
+        return self.extract(source_path, variables=variables)
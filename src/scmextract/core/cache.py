@@ -0,0 +1,67 @@
+"""On-disk cache for extraction results."""
+
+import os
+import pickle
+from pathlib import Path
+from typing import Any, Optional, Union
+
+# Layout version of cached objects. Bump it whenever a cached type such as
+# CausalGraph gains or loses fields, so stale pickles are never loaded.
+CACHE_FORMAT = "5"
+
+
+def get_cache_dir() -> Path:
+    """Return the directory used for cached extraction results.
+
+    Uses ``$SCMEXTRACT_CACHE_DIR`` if set, otherwise ``scmextract`` under
+    ``$XDG_CACHE_HOME`` (default ``~/.cache``).
+
+    Returns:
+        Path to the cache directory (not created).
+    """
+    if os.environ.get("SCMEXTRACT_CACHE_DIR"):
+        return Path(os.environ["SCMEXTRACT_CACHE_DIR"])
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "scmextract"
+
+
+def load_cached(cache_dir: Union[str, Path], key: str) -> Optional[Any]:
+    """Load a cached value.
+
+    Args:
+        cache_dir: Cache directory.
+        key: Cache key.
+
+    Returns:
+        The cached value, or None on a miss or an unreadable entry.
+    """
+    path = Path(cache_dir) / f"{key}.v{CACHE_FORMAT}.pkl"
+    try:
+        with open(path, "rb") as f:
+            return pickle.load(f)
+    except FileNotFoundError:
+        return None
+    except Exception:
+        # Truncated or written by an incompatible version; treat as a miss
+        return None
+
+
+def store_cached(cache_dir: Union[str, Path], key: str, value: Any) -> None:
+    """Store a value in the cache.
+
+    The entry is written to a temporary file and moved into place, so
+    concurrent readers never see a partial pickle.
+
+    Args:
+        cache_dir: Cache directory.
+        key: Cache key.
+        value: Picklable value to store.
+    """
+    cache_dir = Path(cache_dir)
+    cache_dir.mkdir(parents=True, exist_ok=True)
+
+    path = cache_dir / f"{key}.v{CACHE_FORMAT}.pkl"
+    tmp_path = cache_dir / f"{key}.{os.getpid()}.tmp"
+    with open(tmp_path, "wb") as f:
+        pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp_path, path)
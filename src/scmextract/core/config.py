@@ -1,5 +1,6 @@
 """Configuration loading utilities."""
 
+import dataclasses
 from pathlib import Path
 from typing import Any, Dict, Union
 
@@ -7,6 +8,19 @@ import yaml
 
 from scmextract.core.types import ExperimentConfig
 
+# Prefer the libyaml bindings when PyYAML was built with them
+try:
+    from yaml import CSafeDumper as SafeDumper, CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeDumper, SafeLoader
+
+# Config fields, taken from ExperimentConfig so the two cannot drift apart
+_FIELDS = frozenset(f.name for f in dataclasses.fields(ExperimentConfig))
+_REQUIRED_FIELDS = tuple(
+    f.name for f in dataclasses.fields(ExperimentConfig)
+    if f.default is dataclasses.MISSING and f.default_factory is dataclasses.MISSING
+)
+
 
 def load_config(path: Union[str, Path]) -> ExperimentConfig:
     """Load experiment configuration from a YAML file.
@@ -25,8 +39,7 @@ def load_config(path: Union[str, Path]) -> ExperimentConfig:
     if not path.exists():
         raise FileNotFoundError(f"Config file not found: {path}")
 
-    with open(path, 'r') as f:
-        data = yaml.safe_load(f)
+    data = yaml.load(path.read_bytes(), Loader=SafeLoader)
 
     return parse_config(data)
 
@@ -41,21 +54,17 @@ def parse_config(data: Dict[str, Any]) -> ExperimentConfig:
         ExperimentConfig instance.
 
     Raises:
-        ValueError: If required fields are missing.
+        ValueError: If the data is not a mapping or required fields are missing.
     """
-    required_fields = ['name', 'simulator', 'extractor']
-    for field in required_fields:
-        if field not in data:
-            raise ValueError(f"Missing required config field: {field}")
+    if not isinstance(data, dict):
+        raise ValueError(f"Config must be a mapping, got {type(data).__name__}")
+
+    missing = [field for field in _REQUIRED_FIELDS if field not in data]
+    if missing:
+        raise ValueError(f"Missing required config field(s): {', '.join(missing)}")
 
-    return ExperimentConfig(
-        name=data['name'],
-        simulator=data['simulator'],
-        extractor=data['extractor'],
-        variables=data.get('variables'),
-        output_dir=data.get('output_dir', 'results'),
-        options=data.get('options', {}),
-    )
+    # Unknown keys are ignored; omitted optional fields take the dataclass defaults
+    return ExperimentConfig(**{key: value for key, value in data.items() if key in _FIELDS})
 
 
 def save_config(config: ExperimentConfig, path: Union[str, Path]) -> None:
@@ -82,4 +91,4 @@ def save_config(config: ExperimentConfig, path: Union[str, Path]) -> None:
         data['options'] = config.options
 
     with open(path, 'w') as f:
-        yaml.dump(data, f, default_flow_style=False, sort_keys=False)
+        yaml.dump(data, f, Dumper=SafeDumper, default_flow_style=False, sort_keys=False)
@@ -0,0 +1,35 @@
+"""Pre-parsed source shared between extractors."""
+
+import ast
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Union
+
+
+@dataclass(frozen=True)
+class ExtractionContext:
+    """A source file read and parsed once, for reuse across extractors.
+
+    Attributes:
+        source_path: Path to the Python source file.
+        source_bytes: Raw contents of the file.
+        ast_tree: Parsed module. Extractors must not modify it.
+    """
+    source_path: Path
+    source_bytes: bytes
+    ast_tree: ast.Module
+
+    @classmethod
+    def from_path(cls, source_path: Union[str, Path]) -> "ExtractionContext":
+        """Read and parse a Python source file.
+
+        Args:
+            source_path: Path to the Python source file.
+
+        Returns:
+            ExtractionContext for the file.
+        """
+        source_path = Path(source_path)
+        source_bytes = source_path.read_bytes()
+        ast_tree = ast.parse(source_bytes, filename=str(source_path))
+        return cls(source_path=source_path, source_bytes=source_bytes, ast_tree=ast_tree)
@@ -0,0 +1,71 @@
+"""File output helpers."""
+
+import gzip
+import json
+from pathlib import Path
+from typing import Any, Set, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+
+def ensure_dir(path: Union[str, Path], created: Set[Path]) -> Path:
+    """Create a directory and its parents, once per ``created`` set.
+
+    Directories already in ``created``, or parents of one, are returned
+    without touching the filesystem; newly created ones are added to it.
+    The set belongs to the caller and should only live as long as one
+    batch of writes (e.g. one benchmark run), since a directory deleted
+    after it was recorded is not recreated.
+
+    Args:
+        path: Directory path.
+        created: Directories already created by the caller.
+
+    Returns:
+        The directory as a Path.
+    """
+    path = Path(path)
+    if path not in created:
+        path.mkdir(parents=True, exist_ok=True)
+        created.add(path)
+        created.update(path.parents)
+    return path
+
+
+def _encode_json(obj: Any, indent: bool) -> bytes:
+    """Serialize an object to UTF-8 JSON, via orjson when available."""
+    if orjson is not None:
+        option = orjson.OPT_SERIALIZE_NUMPY
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        try:
+            return orjson.dumps(obj, option=option)
+        except TypeError:
+            # Types orjson doesn't handle, e.g. non-string dict keys
+            pass
+
+    if indent:
+        return json.dumps(obj, indent=2).encode()
+    return json.dumps(obj, separators=(",", ":")).encode()
+
+
+def dump_json(obj: Any, path: Union[str, Path]) -> None:
+    """Write an object as JSON.
+
+    Uses ``orjson`` when installed (``pip install scmextract[fast]``) and
+    falls back to the standard library otherwise. Paths ending in ``.gz``
+    are written as compact, gzip-compressed JSON; anything else is indented.
+
+    Args:
+        obj: JSON-serializable object.
+        path: Output file path.
+    """
+    path = Path(path)
+    if path.suffix == ".gz":
+        with gzip.open(path, "wb") as f:
+            f.write(_encode_json(obj, indent=False))
+    else:
+        path.write_bytes(_encode_json(obj, indent=True))
@@ -1,22 +1,44 @@
 """Core data types for SCM extraction."""
 
+import sys
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Any
+from types import MappingProxyType
+from typing import Dict, FrozenSet, Iterator, List, Mapping, Optional, Any, Tuple
 import numpy as np
 
+# Store instance attributes in slots rather than a per-instance __dict__
+# where dataclasses support it (Python 3.10+)
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+@dataclass(**_SLOTS)
 class CausalGraph:
     """Represents a causal graph as an adjacency matrix.
 
+    Edges and dependencies are computed from the adjacency matrix on first
+    use and cached. To keep them valid, the graph holds a read-only copy of
+    the matrix.
+
     Attributes:
         variables: Ordered list of variable names.
-        adjacency_matrix: Binary matrix where adj[i,j]=1 means variable i causes variable j.
+        adjacency_matrix: Boolean matrix where adj[i,j] is True if variable i causes
+            variable j. Matrices of other dtypes (e.g. int8 0/1) are converted
+            on construction.
         metadata: Optional dictionary for additional information.
     """
     variables: List[str]
     adjacency_matrix: np.ndarray
     metadata: Optional[Dict[str, Any]] = None
+    _edge_index: Optional[Tuple[List[int], List[int]]] = field(
+        default=None, init=False, repr=False, compare=False)
+    _dependencies: Optional[Dict[str, Tuple[str, ...]]] = field(
+        default=None, init=False, repr=False, compare=False)
+    _edges: Optional[Tuple[Tuple[str, str], ...]] = field(
+        default=None, init=False, repr=False, compare=False)
+    _edge_set: Optional[FrozenSet[Tuple[str, str]]] = field(
+        default=None, init=False, repr=False, compare=False)
+    _packed: Optional[np.ndarray] = field(
+        default=None, init=False, repr=False, compare=False)
 
     def __post_init__(self):
         """Validate the graph structure."""
@@ -26,6 +48,10 @@ class CausalGraph:
                 f"Adjacency matrix shape {self.adjacency_matrix.shape} "
                 f"doesn't match {n} variables"
             )
+        # A private copy, so changes to the caller's array can't invalidate the caches
+        adjacency = np.array(self.adjacency_matrix, dtype=np.bool_)
+        adjacency.flags.writeable = False
+        self.adjacency_matrix = adjacency
         if self.metadata is None:
             self.metadata = {}
 
@@ -49,49 +75,111 @@ class CausalGraph:
 
         n = len(variables)
         var_to_idx = {v: i for i, v in enumerate(variables)}
-        adj = np.zeros((n, n), dtype=np.int8)
+        adj = np.zeros((n, n), dtype=np.bool_)
 
+        # Collect edge indices, then set them with a single fancy-indexed store
+        rows: List[int] = []
+        cols: List[int] = []
         for target, parents in dependencies.items():
             if target not in var_to_idx:
                 continue
             j = var_to_idx[target]
             for parent in parents:
                 if parent in var_to_idx:
-                    i = var_to_idx[parent]
-                    adj[i, j] = 1
+                    rows.append(var_to_idx[parent])
+                    cols.append(j)
+        if rows:
+            adj[rows, cols] = True
 
         return cls(variables=variables, adjacency_matrix=adj)
 
+    @property
+    def dependencies(self) -> Mapping[str, Tuple[str, ...]]:
+        """Read-only mapping of each variable to the tuple of its parents.
+
+        Only variables with at least one parent appear, with parents in
+        variable order. The mapping is built once and shared by all callers;
+        use :meth:`to_dependencies` for a modifiable copy.
+        """
+        if self._dependencies is None:
+            grouped: Dict[str, List[str]] = {}
+            variables = self.variables
+            rows, cols = self._nonzero()
+            # Stable sort by child keeps each child's parents in variable order
+            for k in sorted(range(len(cols)), key=cols.__getitem__):
+                grouped.setdefault(variables[cols[k]], []).append(variables[rows[k]])
+            self._dependencies = {child: tuple(parents) for child, parents in grouped.items()}
+        return MappingProxyType(self._dependencies)
+
     def to_dependencies(self) -> Dict[str, List[str]]:
         """Convert adjacency matrix back to dependency dictionary.
 
         Returns:
-            Dict mapping each variable to its list of parents.
+            Dict mapping each variable to its list of parents. The result is
+            a fresh copy that callers may modify.
         """
-        dependencies = {}
-        n = len(self.variables)
-        for j in range(n):
-            parents = []
-            for i in range(n):
-                if self.adjacency_matrix[i, j] == 1:
-                    parents.append(self.variables[i])
-            if parents:
-                dependencies[self.variables[j]] = parents
-        return dependencies
+        return {child: list(parents) for child, parents in self.dependencies.items()}
+
+    def _nonzero(self) -> Tuple[List[int], List[int]]:
+        """Return the cached (rows, cols) indices of the edges, row-major."""
+        if self._edge_index is None:
+            rows, cols = np.nonzero(self.adjacency_matrix)
+            self._edge_index = (rows.tolist(), cols.tolist())
+        return self._edge_index
+
+    def iter_edges_indexed(self) -> Iterator[Tuple[int, int]]:
+        """Iterate over directed edges as (parent index, child index) pairs.
+
+        Indices refer to positions in ``variables``; edges come in row-major
+        order, matching :meth:`get_edges`.
+        """
+        return zip(*self._nonzero())
+
+    def _ordered_edges(self) -> Tuple[Tuple[str, str], ...]:
+        """Return the cached edges in row-major adjacency order."""
+        if self._edges is None:
+            variables = self.variables
+            self._edges = tuple(
+                (variables[i], variables[j]) for i, j in self.iter_edges_indexed()
+            )
+        return self._edges
 
     def get_edges(self) -> List[tuple]:
         """Get list of directed edges as (parent, child) tuples."""
-        edges = []
-        n = len(self.variables)
-        for i in range(n):
-            for j in range(n):
-                if self.adjacency_matrix[i, j] == 1:
-                    edges.append((self.variables[i], self.variables[j]))
-        return edges
+        return list(self._ordered_edges())
+
+    def edge_set(self) -> FrozenSet[Tuple[str, str]]:
+        """Return the directed edges as a frozenset of (parent, child) tuples.
+
+        The set is built once and shared by all callers.
+        """
+        if self._edge_set is None:
+            self._edge_set = frozenset(self._ordered_edges())
+        return self._edge_set
+
+    def packed_adjacency(self) -> np.ndarray:
+        """Return the adjacency matrix packed into a flat bitmap.
+
+        Entries are packed row-major, one bit each, into ``uint64`` words
+        (zero-padded at the end). Two graphs over the same variables can be
+        compared with bitwise operations on their bitmaps. The bitmap is
+        built once and cached.
+
+        Returns:
+            Read-only 1-D array of ``uint64`` words.
+        """
+        if self._packed is None:
+            bits = np.packbits(self.adjacency_matrix.ravel())
+            padded = np.zeros(-(-bits.size // 8) * 8, dtype=np.uint8)
+            padded[:bits.size] = bits
+            packed = padded.view(np.uint64)
+            packed.flags.writeable = False
+            self._packed = packed
+        return self._packed
 
     def num_edges(self) -> int:
         """Return the number of edges in the graph."""
-        return int(np.sum(self.adjacency_matrix))
+        return len(self._nonzero()[0])
 
     def __eq__(self, other: object) -> bool:
         """Check equality with another CausalGraph."""
@@ -106,10 +194,12 @@ class CausalGraph:
         return f"CausalGraph(variables={self.variables}, edges={self.num_edges()})"
 
 
-@dataclass
+@dataclass(frozen=True, **_SLOTS)
 class ExperimentConfig:
     """Configuration for an extraction experiment.
 
+    Configs are immutable; use ``dataclasses.replace`` to derive a modified copy.
+
     Attributes:
         name: Experiment identifier.
         simulator: Name of the simulator to use.
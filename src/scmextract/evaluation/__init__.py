@@ -6,6 +6,7 @@ from scmextract.evaluation.metrics import (
     f1_score,
     structural_hamming_distance,
     evaluate_graph,
+    evaluate_graphs_batch,
 )
 
 __all__ = [
@@ -14,4 +15,5 @@ __all__ = [
     "f1_score",
     "structural_hamming_distance",
     "evaluate_graph",
+    "evaluate_graphs_batch",
 ]
@@ -1,15 +1,26 @@
 """Evaluation metrics for comparing causal graphs."""
 
-from typing import Dict, Set, Tuple
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Dict, FrozenSet, Optional, Sequence, Tuple
 
 import numpy as np
 
 from scmextract.core.types import CausalGraph
 
+if TYPE_CHECKING:
+    import pandas as pd
+
+# Graphs with at least this many adjacency cells are compared on their
+# packed bitmaps, where a hardware popcount (np.bitwise_count, NumPy 2.0+)
+# is available. Below it, packing costs more than it saves.
+_PACKED_MIN_CELLS = 40_000
+_HAS_BITWISE_COUNT = hasattr(np, "bitwise_count")
+
 
 def _get_edge_sets(
     predicted: CausalGraph, ground_truth: CausalGraph
-) -> Tuple[Set[Tuple[str, str]], Set[Tuple[str, str]]]:
+) -> Tuple[FrozenSet[Tuple[str, str]], FrozenSet[Tuple[str, str]]]:
     """Extract edge sets from two graphs for comparison.
 
     Args:
@@ -19,9 +30,67 @@ def _get_edge_sets(
     Returns:
         Tuple of (predicted_edges, true_edges) as sets of (parent, child) tuples.
     """
-    pred_edges = set(predicted.get_edges())
-    true_edges = set(ground_truth.get_edges())
-    return pred_edges, true_edges
+    return predicted.edge_set(), ground_truth.edge_set()
+
+
+def _aligned_adjacency(graph: CausalGraph, variables: Sequence[str]) -> Optional[np.ndarray]:
+    """Return the graph's adjacency matrix reordered to ``variables``.
+
+    Returns None if the graph isn't over exactly those variables.
+    """
+    if graph.variables == variables:
+        return graph.adjacency_matrix
+    if len(graph.variables) != len(variables):
+        return None
+    index = {v: i for i, v in enumerate(graph.variables)}
+    if len(index) != len(variables) or index.keys() != set(variables):
+        return None
+    perm = np.array([index[v] for v in variables], dtype=np.intp)
+    return graph.adjacency_matrix[np.ix_(perm, perm)]
+
+
+def _use_packed(predicted: CausalGraph, ground_truth: CausalGraph) -> bool:
+    """Return whether two graphs should be compared on their packed bitmaps."""
+    variables = predicted.variables
+    return (_HAS_BITWISE_COUNT and len(variables) ** 2 >= _PACKED_MIN_CELLS
+            and variables == ground_truth.variables)
+
+
+def _confusion(predicted: CausalGraph, ground_truth: CausalGraph) -> Tuple[int, int, int]:
+    """Count correct, predicted and true edges.
+
+    Graphs over the same variables are compared directly on their adjacency
+    matrices, after reordering the ground truth if the variable order
+    differs; large graphs in the same order are compared on their packed
+    bitmaps. Graphs over different variables fall back to comparing edge sets.
+
+    Args:
+        predicted: Predicted causal graph.
+        ground_truth: Ground truth causal graph.
+
+    Returns:
+        Tuple of (true positives, predicted edges, true edges).
+    """
+    if _use_packed(predicted, ground_truth):
+        pred_bits = predicted.packed_adjacency()
+        true_bits = ground_truth.packed_adjacency()
+        return (
+            int(np.bitwise_count(pred_bits & true_bits).sum()),
+            int(np.bitwise_count(pred_bits).sum()),
+            int(np.bitwise_count(true_bits).sum()),
+        )
+
+    truth = _aligned_adjacency(ground_truth, predicted.variables)
+    if truth is not None:
+        pred = predicted.adjacency_matrix
+        return (
+            int(np.count_nonzero(pred & truth)),
+            int(np.count_nonzero(pred)),
+            int(np.count_nonzero(truth)),
+        )
+
+    pred_edges, true_edges = _get_edge_sets(predicted, ground_truth)
+    return len(pred_edges & true_edges), len(pred_edges), len(true_edges)
 
 
 def precision(predicted: CausalGraph, ground_truth: CausalGraph) -> float:
@@ -36,13 +105,7 @@ def precision(predicted: CausalGraph, ground_truth: CausalGraph) -> float:
     Returns:
         Precision score between 0 and 1.
     """
-    pred_edges, true_edges = _get_edge_sets(predicted, ground_truth)
-
-    if len(pred_edges) == 0:
-        return 1.0 if len(true_edges) == 0 else 0.0
-
-    true_positives = len(pred_edges & true_edges)
-    return true_positives / len(pred_edges)
+    return evaluate_graph(predicted, ground_truth)["precision"]
 
 
 def recall(predicted: CausalGraph, ground_truth: CausalGraph) -> float:
@@ -57,13 +120,7 @@ def recall(predicted: CausalGraph, ground_truth: CausalGraph) -> float:
     Returns:
         Recall score between 0 and 1.
     """
-    pred_edges, true_edges = _get_edge_sets(predicted, ground_truth)
-
-    if len(true_edges) == 0:
-        return 1.0 if len(pred_edges) == 0 else 0.0
-
-    true_positives = len(pred_edges & true_edges)
-    return true_positives / len(true_edges)
+    return evaluate_graph(predicted, ground_truth)["recall"]
 
 
 def f1_score(predicted: CausalGraph, ground_truth: CausalGraph) -> float:
@@ -78,13 +135,7 @@ def f1_score(predicted: CausalGraph, ground_truth: CausalGraph) -> float:
     Returns:
         F1 score between 0 and 1.
     """
-    p = precision(predicted, ground_truth)
-    r = recall(predicted, ground_truth)
-
-    if p + r == 0:
-        return 0.0
-
-    return 2 * (p * r) / (p + r)
+    return evaluate_graph(predicted, ground_truth)["f1"]
 
 
 def structural_hamming_distance(predicted: CausalGraph, ground_truth: CausalGraph) -> int:
@@ -97,6 +148,10 @@ def structural_hamming_distance(predicted: CausalGraph, ground_truth: CausalGrap
     SHD = |predicted - truth| + |truth - predicted|
         = FP + FN
 
+    The edges in exactly one of the two graphs are counted directly, with
+    an XOR of the adjacency matrices (or packed bitmaps) when the graphs
+    share their variables, and a symmetric difference of edge sets otherwise.
+
     Args:
         predicted: Predicted causal graph.
         ground_truth: Ground truth causal graph.
@@ -104,17 +159,52 @@ def structural_hamming_distance(predicted: CausalGraph, ground_truth: CausalGrap
     Returns:
         SHD as non-negative integer.
     """
+    if _use_packed(predicted, ground_truth):
+        mismatched = predicted.packed_adjacency() ^ ground_truth.packed_adjacency()
+        return int(np.bitwise_count(mismatched).sum())
+
+    truth_adj = _aligned_adjacency(ground_truth, predicted.variables)
+    if truth_adj is not None:
+        return int(np.count_nonzero(predicted.adjacency_matrix ^ truth_adj))
+
     pred_edges, true_edges = _get_edge_sets(predicted, ground_truth)
+    return len(pred_edges ^ true_edges)
+
 
-    false_positives = len(pred_edges - true_edges)
-    false_negatives = len(true_edges - pred_edges)
+def _scores_from_counts(true_positives: int, num_pred: int, num_true: int) -> Dict[str, float]:
+    """Derive all metrics from edge counts.
 
-    return false_positives + false_negatives
+    Args:
+        true_positives: Number of predicted edges that are in the ground truth.
+        num_pred: Number of predicted edges.
+        num_true: Number of ground truth edges.
+
+    Returns:
+        Dictionary with keys: precision, recall, f1, shd
+    """
+    if num_pred:
+        p = true_positives / num_pred
+    else:
+        p = 1.0 if num_true == 0 else 0.0
+    if num_true:
+        r = true_positives / num_true
+    else:
+        r = 1.0 if num_pred == 0 else 0.0
+    f1 = 0.0 if p + r == 0 else 2 * (p * r) / (p + r)
+
+    return {
+        "precision": p,
+        "recall": r,
+        "f1": f1,
+        "shd": (num_pred - true_positives) + (num_true - true_positives),
+    }
 
 
 def evaluate_graph(predicted: CausalGraph, ground_truth: CausalGraph) -> Dict[str, float]:
     """Compute all evaluation metrics for a predicted graph.
 
+    The edge counts are computed once and all metrics derived from them.
+
     Args:
         predicted: Predicted causal graph.
         ground_truth: Ground truth causal graph.
@@ -122,9 +212,64 @@ def evaluate_graph(predicted: CausalGraph, ground_truth: CausalGraph) -> Dict[st
     Returns:
         Dictionary with keys: precision, recall, f1, shd
     """
-    return {
-        "precision": precision(predicted, ground_truth),
-        "recall": recall(predicted, ground_truth),
-        "f1": f1_score(predicted, ground_truth),
-        "shd": structural_hamming_distance(predicted, ground_truth),
-    }
+    return _scores_from_counts(*_confusion(predicted, ground_truth))
+
+
+def evaluate_graphs_batch(predictions: Sequence[CausalGraph],
+                          ground_truth: CausalGraph) -> pd.DataFrame:
+    """Evaluate many predicted graphs against one ground truth.
+
+    Predictions over the ground truth's variables are stacked into a single
+    ``(B, n, n)`` array and scored with one vectorized reduction; those in a
+    different variable order are reordered first. Predictions over other
+    variables are scored individually, as in :func:`evaluate_graph`.
+
+    Args:
+        predictions: Predicted causal graphs.
+        ground_truth: Ground truth causal graph.
+
+    Returns:
+        DataFrame with one row per prediction, in order, and columns
+        precision, recall, f1, shd.
+    """
+    import pandas as pd
+
+    num = len(predictions)
+    true_positives = np.zeros(num, dtype=np.int64)
+    num_pred = np.zeros(num, dtype=np.int64)
+
+    truth = ground_truth.adjacency_matrix
+    num_true = int(np.count_nonzero(truth))
+
+    aligned_rows, aligned = [], []
+    for row, graph in enumerate(predictions):
+        adj = _aligned_adjacency(graph, ground_truth.variables)
+        if adj is None:
+            true_positives[row], num_pred[row], _ = _confusion(graph, ground_truth)
+        else:
+            aligned_rows.append(row)
+            aligned.append(adj)
+
+    if aligned:
+        stacked = np.stack(aligned).reshape(len(aligned), -1)
+        true_positives[aligned_rows] = np.count_nonzero(stacked & truth.reshape(1, -1), axis=1)
+        num_pred[aligned_rows] = np.count_nonzero(stacked, axis=1)
+
+    # Same conventions as _scores_from_counts, vectorized over predictions
+    empty_truth = 1.0 if num_true == 0 else 0.0
+    precision_ = np.full(num, empty_truth)
+    np.divide(true_positives, num_pred, out=precision_, where=num_pred > 0)
+    if num_true:
+        recall_ = true_positives / num_true
+    else:
+        recall_ = np.where(num_pred == 0, 1.0, 0.0)
+    denom = precision_ + recall_
+    f1 = np.zeros(num)
+    np.divide(2 * precision_ * recall_, denom, out=f1, where=denom > 0)
+
+    return pd.DataFrame({
+        "precision": precision_,
+        "recall": recall_,
+        "f1": f1,
+        "shd": (num_pred - true_positives) + (num_true - true_positives),
+    })
@@ -1,73 +1,112 @@
 """AST-based causal graph extraction from Python source code."""
 
 import ast
+import functools
+from collections.abc import Set as AbstractSet
 from pathlib import Path
-from typing import Dict, List, Optional, Set
+from typing import Collection, Dict, Optional, Set
 
 from scmextract.core.base import BaseExtractor
+from scmextract.core.context import ExtractionContext
 from scmextract.core.types import CausalGraph
 from scmextract.extractors.registry import ExtractorRegistry
 
 
+@functools.lru_cache(maxsize=32)
+def _parse_cached(source_code: str) -> ast.Module:
+    """Parse Python source, reusing the tree for source seen before.
+
+    The returned tree is shared between callers and must not be modified.
+    """
+    return ast.parse(source_code)
+
+
+class _NameCollector(ast.NodeVisitor):
+    """Collects the names and attribute names referenced in an expression."""
+
+    def __init__(self):
+        self.names: Set[str] = set()
+
+    def visit_Name(self, node: ast.Name) -> None:
+        self.names.add(node.id)
+
+    def visit_Attribute(self, node: ast.Attribute) -> None:
+        self.names.add(node.attr)
+        self.visit(node.value)
+
+    def visit_Constant(self, node: ast.Constant) -> None:
+        # Leaf node; nothing to collect
+        pass
+
+
 class CausalASTVisitor(ast.NodeVisitor):
     """AST visitor that extracts causal dependencies between variables."""
 
     def __init__(self, variables_of_interest: Optional[Set[str]] = None, include_self_loops: bool = True):
-        self.dependencies: Dict[str, List[str]] = {}
+        self.dependencies: Dict[str, Set[str]] = {}
         self.variables_of_interest = variables_of_interest
         self.include_self_loops = include_self_loops
+        self._collector = _NameCollector()
 
-    def _get_referenced_names(self, node: ast.AST) -> List[str]:
+    def _get_referenced_names(self, node: ast.AST) -> Set[str]:
         """Extract all variable names referenced in an expression."""
-        names = []
-        for child in ast.walk(node):
-            if isinstance(child, ast.Name):
-                names.append(child.id)
-            elif isinstance(child, ast.Attribute):
-                names.append(child.attr)
+        collector = self._collector
+        collector.names = set()
+        collector.visit(node)
 
+        names = collector.names
         if self.variables_of_interest:
-            names = [n for n in names if n in self.variables_of_interest]
-        return list(set(names))
+            names.intersection_update(self.variables_of_interest)
+        return names
 
-    def _add_dependency(self, target: str, deps: List[str]) -> None:
-        """Add dependencies for a target variable."""
+    def _add_dependency(self, target: str, deps: Set[str]) -> None:
+        """Add dependencies for a target variable.
+
+        ``deps`` is a fresh set owned by the caller and may be modified.
+        """
         if not self.include_self_loops:
-            deps = [d for d in deps if d != target]
-        if not deps:
-            return
-        if target in self.dependencies:
-            self.dependencies[target] = list(set(self.dependencies[target] + deps))
-        else:
-            self.dependencies[target] = deps
+            deps.discard(target)
+        if deps:
+            self.dependencies.setdefault(target, set()).update(deps)
 
     def visit_Assign(self, node: ast.Assign) -> None:
-        """Handle: X = expression"""
+        """Handle: X = expression and X[index] = expression"""
         target = node.targets[0]
+        # An item assignment updates the container it indexes into
+        while isinstance(target, ast.Subscript):
+            target = target.value
         if isinstance(target, ast.Name):
             target_name = target.id
         elif isinstance(target, ast.Attribute):
             target_name = target.attr
         else:
-            self.generic_visit(node)
-            return
-
-        if self.variables_of_interest and target_name not in self.variables_of_interest:
-            self.generic_visit(node)
+            target_name = None
+
+        if target_name is None or (
+                self.variables_of_interest and target_name not in self.variables_of_interest):
+            # Expressions can't contain further assignments, so only calls such
+            # as X.append(...) matter here; find them without full visitor dispatch
+            for child in ast.walk(node):
+                if isinstance(child, ast.Call):
+                    self._record_call(child)
             return
 
         deps = self._get_referenced_names(node.value)
         self._add_dependency(target_name, deps)
         self.generic_visit(node)
 
-    def visit_Call(self, node: ast.Call) -> None:
-        """Handle: X.append(expression) and similar mutations."""
+    def _record_call(self, node: ast.Call) -> None:
+        """Record the dependency added by a single call, if it is a mutation."""
         if isinstance(node.func, ast.Attribute) and node.func.attr == "append":
             if isinstance(node.func.value, ast.Name):
                 target_name = node.func.value.id
                 if self.variables_of_interest is None or target_name in self.variables_of_interest:
-                    deps = self._get_referenced_names(node.args[0]) if node.args else []
+                    deps = self._get_referenced_names(node.args[0]) if node.args else set()
                     self._add_dependency(target_name, deps)
+
+    def visit_Call(self, node: ast.Call) -> None:
+        """Handle: X.append(expression) and similar mutations."""
+        self._record_call(node)
         self.generic_visit(node)
 
 
@@ -79,38 +118,62 @@ class ASTExtractor(BaseExtractor):
     relationships by tracking variable assignments and mutations.
     """
 
+    VERSION = "1"
+
     def __init__(self, include_self_loops: bool = True):
         self.include_self_loops = include_self_loops
 
-    def extract(self, source_path: Path, variables: Optional[Set[str]] = None) -> CausalGraph:
+    def extract(self, source_path: Path, variables: Optional[Collection[str]] = None,
+                context: Optional[ExtractionContext] = None) -> CausalGraph:
         """Extract causal graph from a Python source file.
 
         Args:
             source_path: Path to the Python file.
-            variables: Optional set of variables to focus on.
+            variables: Optional variables to focus on. A sequence fixes the
+                       variable order of the graph; a set is sorted.
+            context: Optional pre-parsed source; its AST is used instead of
+                     reading and parsing ``source_path``.
 
         Returns:
             CausalGraph with extracted dependencies.
         """
+        if context is not None:
+            return self._extract_from_tree(context.ast_tree, variables)
+
         source_path = Path(source_path)
         with open(source_path, "r") as f:
             source_code = f.read()
 
         return self.extract_from_string(source_code, variables)
 
-    def extract_from_string(self, source_code: str, variables: Optional[Set[str]] = None) -> CausalGraph:
+    def extract_from_string(self, source_code: str,
+                            variables: Optional[Collection[str]] = None) -> CausalGraph:
         """Extract causal graph from Python source code string.
 
+        Parsed trees are cached, so extracting different variables from the
+        same source only parses it once.
+
         Args:
             source_code: Python source code.
-            variables: Optional set of variables to focus on.
+            variables: Optional variables to focus on (see :meth:`extract`).
 
         Returns:
             CausalGraph with extracted dependencies.
         """
-        tree = ast.parse(source_code)
+        return self._extract_from_tree(_parse_cached(source_code), variables)
+
+    def _extract_from_tree(self, tree: ast.AST, variables: Optional[Collection[str]]) -> CausalGraph:
+        """Extract causal graph from a parsed module."""
+        if variables and not isinstance(variables, AbstractSet):
+            # Keep the caller's order for the graph, without repeated names;
+            # the visitor needs a set
+            var_list = list(dict.fromkeys(variables))
+            variables = frozenset(var_list)
+        else:
+            var_list = sorted(variables) if variables else None
+
         visitor = CausalASTVisitor(variables_of_interest=variables, include_self_loops=self.include_self_loops)
         visitor.visit(tree)
 
-        var_list = sorted(variables) if variables else None
-        return CausalGraph.from_dependencies(visitor.dependencies, variables=var_list)
+        dependencies = {target: sorted(parents) for target, parents in visitor.dependencies.items()}
+        return CausalGraph.from_dependencies(dependencies, variables=var_list)
@@ -1,6 +1,8 @@
 """Extractor registry for discovering and accessing extraction methods."""
 
-from typing import Dict, Type
+import functools
+from types import MappingProxyType
+from typing import Dict, Mapping, Type
 
 from scmextract.core.base import BaseExtractor
 
@@ -9,6 +11,8 @@ class ExtractorRegistry:
     """Registry for extractor classes."""
 
     _extractors: Dict[str, Type[BaseExtractor]] = {}
+    # Read-only live view handed out by list_extractors()
+    _extractors_view: Mapping[str, Type[BaseExtractor]] = MappingProxyType(_extractors)
 
     @classmethod
     def register(cls, name: str):
@@ -23,6 +27,7 @@ class ExtractorRegistry:
         def decorator(extractor_cls: Type[BaseExtractor]):
             cls._extractors[name] = extractor_cls
             extractor_cls.name = name
+            get_extractor.cache_clear()
             return extractor_cls
         return decorator
 
@@ -47,18 +52,25 @@ class ExtractorRegistry:
         return cls._extractors[name]
 
     @classmethod
-    def list_extractors(cls) -> Dict[str, Type[BaseExtractor]]:
+    def list_extractors(cls) -> Mapping[str, Type[BaseExtractor]]:
         """Return all registered extractors.
 
         Returns:
-            Dictionary mapping names to extractor classes.
+            Read-only mapping from names to extractor classes. It is a live view,
+            so it reflects extractors registered later; copy it with ``dict()``
+            to take a snapshot.
         """
-        return cls._extractors.copy()
+        return cls._extractors_view
 
 
+@functools.lru_cache(maxsize=None)
 def get_extractor(name: str) -> BaseExtractor:
     """Convenience function to get an extractor instance.
 
+    Extractors are constructed with default options and keep no state
+    between calls, so one instance per name is cached and shared between
+    callers. Construct the class directly for other options.
+
     Args:
         name: Extractor identifier.
 
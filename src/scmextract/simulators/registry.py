@@ -1,6 +1,8 @@
 """Simulator registry for discovering and accessing simulators."""
 
-from typing import Dict, Type
+import functools
+from types import MappingProxyType
+from typing import Dict, Mapping, Type
 
 from scmextract.core.base import BaseSimulator
 
@@ -9,6 +11,8 @@ class SimulatorRegistry:
     """Registry for simulator classes."""
 
     _simulators: Dict[str, Type[BaseSimulator]] = {}
+    # Read-only live view handed out by list_simulators()
+    _simulators_view: Mapping[str, Type[BaseSimulator]] = MappingProxyType(_simulators)
 
     @classmethod
     def register(cls, name: str):
@@ -23,6 +27,7 @@ class SimulatorRegistry:
         def decorator(simulator_cls: Type[BaseSimulator]):
             cls._simulators[name] = simulator_cls
             simulator_cls.name = name
+            get_simulator.cache_clear()
             return simulator_cls
         return decorator
 
@@ -47,18 +52,25 @@ class SimulatorRegistry:
         return cls._simulators[name]
 
     @classmethod
-    def list_simulators(cls) -> Dict[str, Type[BaseSimulator]]:
+    def list_simulators(cls) -> Mapping[str, Type[BaseSimulator]]:
         """Return all registered simulators.
 
         Returns:
-            Dictionary mapping names to simulator classes.
+            Read-only mapping from names to simulator classes. It is a live view,
+            so it reflects simulators registered later; copy it with ``dict()``
+            to take a snapshot.
         """
-        return cls._simulators.copy()
+        return cls._simulators_view
 
 
+@functools.lru_cache(maxsize=None)
 def get_simulator(name: str) -> BaseSimulator:
     """Convenience function to get a simulator instance.
 
+    Simulators are constructed with default arguments, so one instance per
+    name is cached and shared between callers. Treat it as read-only;
+    construct the class directly for custom parameters.
+
     Args:
         name: Simulator identifier.
 
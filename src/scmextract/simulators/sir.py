@@ -1,15 +1,60 @@
 """SIR (Susceptible-Infected-Resistant) epidemic model simulator."""
 
+from __future__ import annotations
+
+import copy
+import functools
 from pathlib import Path
-from typing import List
+from typing import TYPE_CHECKING, Callable, ClassVar, List, Optional
 
 import numpy as np
-import pandas as pd
 
 from scmextract.core.base import BaseSimulator
 from scmextract.core.types import CausalGraph
 from scmextract.simulators.registry import SimulatorRegistry
 
+if TYPE_CHECKING:
+    import pandas as pd
+
+
+def _simulate(Susceptible, Infected, Resistant, rateSI, rateIR, numIndividuals) -> None:
+    """Advance the SIR recurrence in place.
+
+    Fills every step after the first from the initial values already stored
+    at index 0. Accepts NumPy arrays (JIT-compiled) or plain lists.
+    """
+    for step in range(1, len(Susceptible)):
+        S_to_I = (rateSI * Susceptible[step - 1] * Infected[step - 1]) / numIndividuals
+        I_to_R = Infected[step - 1] * rateIR
+
+        Susceptible[step] = Susceptible[step - 1] - S_to_I
+        Infected[step] = Infected[step - 1] + S_to_I - I_to_R
+        Resistant[step] = Resistant[step - 1] + I_to_R
+
+
+# Model variables, in the order used by the ground truth graph
+_STATE_VARIABLES = ("Susceptible", "Infected", "Resistant")
+_ALL_VARIABLES = (
+    "Susceptible", "Infected", "Resistant",
+    "S_to_I", "I_to_R",
+    "rateSI", "rateIR", "numIndividuals",
+)
+
+
+@functools.lru_cache(maxsize=None)
+def _compiled_simulate() -> Optional[Callable]:
+    """Return ``_simulate`` JIT-compiled with numba, or None without numba.
+
+    numba is imported here rather than at module import, so loading the
+    simulator (e.g. for the CLI) doesn't pay for it. Install it with
+    ``pip install scmextract[jit]``.
+    """
+    try:
+        from numba import njit
+    except ImportError:  # pragma: no cover - optional dependency
+        return None
+    return njit(cache=True)(_simulate)
+
 
 @SimulatorRegistry.register("sir")
 class SIRSimulator(BaseSimulator):
@@ -31,6 +76,9 @@ class SIRSimulator(BaseSimulator):
         - N: Total population
     """
 
+    # Built once for all instances; the causal structure doesn't depend on parameters
+    _ground_truth: ClassVar[Optional[CausalGraph]] = None
+
     def __init__(
         self,
         susceptible: int = 950,
@@ -61,15 +109,11 @@ class SIRSimulator(BaseSimulator):
 
     def get_state_variables(self) -> List[str]:
         """Return the main state variables."""
-        return ["Susceptible", "Infected", "Resistant"]
+        return list(_STATE_VARIABLES)
 
     def get_all_variables(self) -> List[str]:
         """Return all variables including parameters and intermediates."""
-        return [
-            "Susceptible", "Infected", "Resistant",
-            "S_to_I", "I_to_R",
-            "rateSI", "rateIR", "numIndividuals"
-        ]
+        return list(_ALL_VARIABLES)
 
     def get_ground_truth_graph(self) -> CausalGraph:
         """Return the true causal structure of the SIR model.
@@ -80,18 +124,32 @@ class SIRSimulator(BaseSimulator):
         - Susceptible_t = f(Susceptible_{t-1}, S_to_I)
         - Infected_t = f(Infected_{t-1}, S_to_I, I_to_R)
         - Resistant_t = f(Resistant_{t-1}, I_to_R)
-        """
-        variables = self.get_all_variables()
-
-        dependencies = {
-            "S_to_I": ["rateSI", "Susceptible", "Infected", "numIndividuals"],
-            "I_to_R": ["Infected", "rateIR"],
-            "Susceptible": ["Susceptible", "S_to_I"],
-            "Infected": ["Infected", "S_to_I", "I_to_R"],
-            "Resistant": ["Resistant", "I_to_R"],
-        }
 
-        return CausalGraph.from_dependencies(dependencies, variables=variables)
+        The structure is built once and shared between calls and instances.
+        Each call returns a shallow copy with its own ``variables`` list and
+        ``metadata`` dict, so callers can't modify what other callers see;
+        the read-only adjacency matrix and edge caches are shared.
+        """
+        cls = type(self)
+        if cls._ground_truth is None:
+            dependencies = {
+                "S_to_I": ["rateSI", "Susceptible", "Infected", "numIndividuals"],
+                "I_to_R": ["Infected", "rateIR"],
+                "Susceptible": ["Susceptible", "S_to_I"],
+                "Infected": ["Infected", "S_to_I", "I_to_R"],
+                "Resistant": ["Resistant", "I_to_R"],
+            }
+
+            shared = CausalGraph.from_dependencies(dependencies, variables=list(_ALL_VARIABLES))
+            # Fill the edge caches once, so every copy starts with them
+            shared.to_dependencies()
+            shared.edge_set()
+            cls._ground_truth = shared
+
+        graph = copy.copy(cls._ground_truth)
+        graph.variables = list(graph.variables)
+        graph.metadata = {}
+        return graph
 
     def run(self, steps: int = 1000, **kwargs) -> pd.DataFrame:
         """Run the SIR simulation.
@@ -102,28 +160,40 @@ class SIRSimulator(BaseSimulator):
         Returns:
             DataFrame with columns: Time, Susceptible, Infected, Resistant
         """
-        Susceptible = [self.initial_susceptible]
-        Infected = [self.initial_infected]
-        Resistant = [self.initial_resistant]
+        import pandas as pd
+
+        # The initial state is always included
+        num_rows = max(steps, 1)
+        compiled = _compiled_simulate()
+        if compiled is not None:
+            Susceptible = np.empty(num_rows)
+            Infected = np.empty(num_rows)
+            Resistant = np.empty(num_rows)
+            simulate = compiled
+        else:
+            # Interpreted, list indexing is much cheaper than ndarray indexing
+            Susceptible = [0.0] * num_rows
+            Infected = [0.0] * num_rows
+            Resistant = [0.0] * num_rows
+            simulate = _simulate
+
+        Susceptible[0] = self.initial_susceptible
+        Infected[0] = self.initial_infected
+        Resistant[0] = self.initial_resistant
 
         rateSI = self.rate_si
         rateIR = self.rate_ir
         numIndividuals = self.population
 
-        for step in range(1, steps):
-            S_to_I = (rateSI * Susceptible[-1] * Infected[-1]) / numIndividuals
-            I_to_R = Infected[-1] * rateIR
-
-            Susceptible.append(Susceptible[-1] - S_to_I)
-            Infected.append(Infected[-1] + S_to_I - I_to_R)
-            Resistant.append(Resistant[-1] + I_to_R)
+        simulate(Susceptible, Infected, Resistant, rateSI, rateIR, numIndividuals)
 
+        # Hand pandas float64 arrays it can adopt without another copy
         return pd.DataFrame({
-            "Time": list(range(len(Susceptible))),
-            "Susceptible": Susceptible,
-            "Infected": Infected,
-            "Resistant": Resistant,
-        })
+            "Time": np.arange(num_rows),
+            "Susceptible": np.asarray(Susceptible, dtype=np.float64),
+            "Infected": np.asarray(Infected, dtype=np.float64),
+            "Resistant": np.asarray(Resistant, dtype=np.float64),
+        }, copy=False)
 
     def plot(self, results: pd.DataFrame = None, output_path: str = "sir_plot.png"):
         """Plot the SIR simulation results.
@@ -1,11 +1,13 @@
 """Visualization utilities for causal graphs."""
 
 from pathlib import Path
-from typing import Dict, Optional, Set
+from typing import Dict, Iterator, Optional, Set
 
 import matplotlib.pyplot as plt
 import networkx as nx
+from matplotlib.figure import Figure
 
+from scmextract.core.io import dump_json
 from scmextract.core.types import CausalGraph
 
 
@@ -20,11 +22,20 @@ def to_networkx(graph: CausalGraph) -> nx.DiGraph:
     """
     G = nx.DiGraph()
     G.add_nodes_from(graph.variables)
+    G.add_edges_from(graph.get_edges())
+    return G
 
-    for parent, child in graph.get_edges():
-        G.add_edge(parent, child)
 
-    return G
+def _dot_lines(graph: CausalGraph, title: str) -> Iterator[str]:
+    """Yield the lines of the DOT representation, without newlines."""
+    yield f'digraph "{title}" {{'
+    yield "    rankdir=BT;"
+    yield "    node [shape=box];"
+    # Quote each name once rather than once per edge
+    quoted = [f'"{v}"' for v in graph.variables]
+    for i, j in graph.iter_edges_indexed():
+        yield f"    {quoted[i]} -> {quoted[j]};"
+    yield "}"
 
 
 def to_dot(graph: CausalGraph, title: str = "Causal Graph") -> str:
@@ -37,13 +48,7 @@ def to_dot(graph: CausalGraph, title: str = "Causal Graph") -> str:
     Returns:
         DOT format string.
     """
-    lines = [f'digraph "{title}" {{', "    rankdir=BT;", "    node [shape=box];"]
-
-    for parent, child in graph.get_edges():
-        lines.append(f'    "{parent}" -> "{child}";')
-
-    lines.append("}")
-    return "\n".join(lines)
+    return "\n".join(_dot_lines(graph, title))
 
 
 def visualize_graph(
@@ -52,9 +57,13 @@ def visualize_graph(
     title: str = "Causal Graph",
     node_categories: Optional[Dict[str, Set[str]]] = None,
     figsize: tuple = (12, 8),
+    ax=None,
 ) -> None:
     """Visualize a causal graph using matplotlib and networkx.
 
+    When saving to a file the figure is built without pyplot, so concurrent
+    calls from different threads don't share global figure state.
+
     Args:
         graph: CausalGraph to visualize.
         output_path: Path to save the image. If None, displays interactively.
@@ -62,11 +71,18 @@ def visualize_graph(
         node_categories: Optional dict mapping category names to sets of node names.
                         Used for coloring nodes by category.
         figsize: Figure size as (width, height).
+        ax: Optional matplotlib axes to draw into instead of creating a new
+            figure. The axes are cleared first and ``figsize`` is ignored.
     """
     G = to_networkx(graph)
 
-    plt.figure(figsize=figsize)
-    plt.title(title, fontsize=14, fontweight="bold")
+    if ax is not None:
+        ax.clear()
+        fig = ax.figure
+    else:
+        fig = Figure(figsize=figsize) if output_path else plt.figure(figsize=figsize)
+        ax = fig.add_subplot()
+    ax.set_title(title, fontsize=14, fontweight="bold")
 
     # Default color scheme
     default_colors = {
@@ -90,10 +106,10 @@ def visualize_graph(
     pos = nx.spring_layout(G, k=2, iterations=50, seed=42)
 
     # Draw
-    nx.draw_networkx_nodes(G, pos, node_color=color_map, node_size=2500, alpha=0.9)
-    nx.draw_networkx_labels(G, pos, font_size=9, font_weight="bold")
+    nx.draw_networkx_nodes(G, pos, ax=ax, node_color=color_map, node_size=2500, alpha=0.9)
+    nx.draw_networkx_labels(G, pos, ax=ax, font_size=9, font_weight="bold")
     nx.draw_networkx_edges(
-        G, pos, edge_color="#666666", arrows=True,
+        G, pos, ax=ax, edge_color="#666666", arrows=True,
         arrowsize=20, arrowstyle="->", connectionstyle="arc3,rad=0.1"
     )
 
@@ -103,15 +119,14 @@ def visualize_graph(
         for category in node_categories:
             color = default_colors.get(category, "#D3D3D3")
             legend_elements.append(
-                plt.scatter([], [], c=color, s=100, label=category.capitalize())
+                ax.scatter([], [], c=color, s=100, label=category.capitalize())
             )
-        plt.legend(handles=legend_elements, loc="upper left", fontsize=9)
+        ax.legend(handles=legend_elements, loc="upper left", fontsize=9)
 
-    plt.tight_layout()
+    fig.tight_layout()
 
     if output_path:
-        plt.savefig(output_path, dpi=150, bbox_inches="tight", facecolor="white")
-        plt.close()
+        fig.savefig(output_path, dpi=150, bbox_inches="tight", facecolor="white")
     else:
         plt.show()
 
@@ -121,11 +136,10 @@ def save_graph(graph: CausalGraph, output_path: str, format: str = "json") -> No
 
     Args:
         graph: CausalGraph to save.
-        output_path: Output file path.
+        output_path: Output file path. For 'json', a path ending in ``.gz``
+            is written gzip-compressed.
         format: Output format ('json', 'dot', or 'png').
     """
-    import json
-
     output_path = Path(output_path)
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
@@ -137,13 +151,14 @@ def save_graph(graph: CausalGraph, output_path: str, format: str = "json") -> No
         }
         if graph.metadata:
             data["metadata"] = graph.metadata
-        with open(output_path, "w") as f:
-            json.dump(data, f, indent=2)
+        dump_json(data, output_path)
 
     elif format == "dot":
-        dot_content = to_dot(graph)
+        # Stream the lines so large graphs are never held as one string
+        lines = _dot_lines(graph, "Causal Graph")
         with open(output_path, "w") as f:
-            f.write(dot_content)
+            f.write(next(lines))
+            f.writelines("\n" + line for line in lines)
 
     elif format == "png":
         visualize_graph(graph, output_path=str(output_path))
@@ -4,6 +4,28 @@ import numpy as np
 import pytest
 
 from scmextract.core.types import CausalGraph
+from scmextract.extractors.ast_extractor import ASTExtractor
+from scmextract.simulators.sir import SIRSimulator
+
+
+@pytest.fixture(scope="session")
+def sir_sim():
+    """SIR simulator with default parameters, shared by all tests."""
+    return SIRSimulator()
+
+
+@pytest.fixture(scope="session")
+def ast_extractor():
+    """AST extractor with default options, shared by all tests."""
+    return ASTExtractor()
+
+
+@pytest.fixture(scope="session")
+def sir_extracted_graph(sir_sim, ast_extractor):
+    """Graph extracted from the SIR simulator source, built once per session."""
+    return ast_extractor.extract(
+        sir_sim.get_source_path(), variables=tuple(sir_sim.get_all_variables())
+    )
 
 
 @pytest.fixture
@@ -0,0 +1,150 @@
+"""Tests for the benchmark runner."""
+
+import csv
+import gzip
+import json
+import logging
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+import pytest
+
+from scmextract import benchmark
+from scmextract.benchmark import main, run_benchmark
+from scmextract.extractors.ast_extractor import ASTExtractor
+
+
+class RuntimeExtractor(ASTExtractor):
+    """Extractor registered only inside a test, never at import time.
+
+    Defined at module level so spawned workers can unpickle it.
+    """
+
+
+class TestRunBenchmark:
+    def test_results_and_outputs(self, tmp_path, caplog):
+        """Test that each pair produces a result row and saved outputs."""
+        with caplog.at_level(logging.INFO, logger="scmextract.benchmark"):
+            results = run_benchmark(["ast"], ["sir"], tmp_path, use_cache=False)
+
+        assert len(results) == 1
+        row = results[0]
+        assert row["simulator"] == "sir"
+        assert row["extractor"] == "ast"
+        assert row["f1"] == pytest.approx(1.0)
+        assert row["shd"] == 0
+        assert len(caplog.records) == 1
+
+        assert (tmp_path / "sir" / "ast" / "predicted.json").exists()
+        assert (tmp_path / "sir" / "ast" / "predicted.png").exists()
+
+    def test_summary_files(self, tmp_path):
+        """Test that the summary files match the returned rows."""
+        results = run_benchmark(["ast"], ["sir"], tmp_path, use_cache=False)
+
+        with open(tmp_path / "summary.csv", newline="") as f:
+            rows = list(csv.DictReader(f))
+        assert [(r["simulator"], r["extractor"]) for r in rows] == [("sir", "ast")]
+
+        with open(tmp_path / "summary.jsonl") as f:
+            assert [json.loads(line) for line in f] == results
+
+        with open(tmp_path / "summary.json") as f:
+            summary = json.load(f)
+        assert summary["results"] == results
+        assert summary["extractors"] == ["ast"]
+        assert summary["simulators"] == ["sir"]
+
+    def test_large_summary_is_compressed(self, tmp_path, monkeypatch):
+        """Test that summaries above the row threshold are gzip-compressed."""
+        monkeypatch.setattr(benchmark, "SUMMARY_GZIP_MIN_ROWS", 0)
+        results = run_benchmark(["ast"], ["sir"], tmp_path, use_cache=False)
+
+        assert not (tmp_path / "summary.json").exists()
+        with gzip.open(tmp_path / "summary.json.gz", "rt") as f:
+            assert json.load(f)["results"] == results
+
+    def test_rerun_after_output_deleted(self, tmp_path):
+        """Test that a second run recreates an output directory deleted after the first."""
+        import shutil
+
+        output = tmp_path / "out"
+        run_benchmark(["ast"], ["sir"], output, use_cache=False)
+        shutil.rmtree(output)
+        results = run_benchmark(["ast"], ["sir"], output, use_cache=False)
+
+        assert len(results) == 1
+        assert (output / "summary.csv").exists()
+        assert (output / "sir" / "ast" / "predicted.json").exists()
+
+    def test_no_pairs(self, tmp_path):
+        """Test that an empty grid returns no results."""
+        assert run_benchmark([], ["sir"], tmp_path) == []
+
+    @pytest.mark.parametrize("use_cache", [True, False])
+    def test_extractor_without_context(self, tmp_path, monkeypatch, use_cache):
+        """Test that extractors whose extract() predates ``context`` still run."""
+        from scmextract.core.base import BaseExtractor
+        from scmextract.core.context import ExtractionContext
+        from scmextract.simulators.sir import SIRSimulator
+
+        class LegacyExtractor(BaseExtractor):
+            def extract(self, source_path, variables=None):
+                return ASTExtractor().extract(source_path, variables=variables)
+
+        sim = SIRSimulator()
+        monkeypatch.setenv("SCMEXTRACT_CACHE_DIR", str(tmp_path))
+        monkeypatch.setattr(benchmark, "_SIM_CACHE", {"sir": (
+            sim.get_ground_truth_graph(),
+            tuple(sim.get_all_variables()),
+            ExtractionContext.from_path(sim.get_source_path()),
+        )})
+
+        row, _ = benchmark._run_pair(("sir", "legacy", LegacyExtractor), use_cache=use_cache)
+        assert row["f1"] == pytest.approx(1.0)
+
+
+class TestWorkers:
+    def test_single_pair_runs_in_process(self, tmp_path, monkeypatch):
+        """Test that a one-pair grid doesn't start a process pool."""
+        def no_pool(*args, **kwargs):
+            raise AssertionError("process pool started")
+
+        monkeypatch.setattr(benchmark, "ProcessPoolExecutor", no_pool)
+        results = run_benchmark(["ast"], ["sir"], tmp_path, use_cache=False)
+
+        assert results[0]["f1"] == pytest.approx(1.0)
+        assert benchmark._SIM_CACHE == {}
+
+    def test_runtime_extractor_with_spawn(self, tmp_path, monkeypatch):
+        """Test that spawned workers can run extractors registered at runtime."""
+        import multiprocessing
+
+        from scmextract.extractors.registry import ExtractorRegistry
+
+        monkeypatch.setitem(ExtractorRegistry._extractors, "runtime", RuntimeExtractor)
+        monkeypatch.setattr(benchmark, "ProcessPoolExecutor", partial(
+            ProcessPoolExecutor, mp_context=multiprocessing.get_context("spawn")))
+        results = run_benchmark(["runtime", "ast"], ["sir"], tmp_path, use_cache=False)
+
+        assert [r["extractor"] for r in results] == ["runtime", "ast"]
+        assert all(r["f1"] == pytest.approx(1.0) for r in results)
+
+    def test_unknown_extractor_writes_nothing(self, tmp_path):
+        """Test that an unknown name fails before any output is created."""
+        output = tmp_path / "out"
+        with pytest.raises(KeyError):
+            run_benchmark(["no-such-extractor"], ["sir"], output)
+
+        assert not output.exists()
+
+
+class TestMain:
+    def test_prints_summary_table(self, tmp_path, capsys):
+        """Test that the entry point runs the benchmark and prints a summary."""
+        main(["--output", str(tmp_path), "--extractors", "ast", "--simulators", "sir",
+              "--no-cache"])
+
+        out = capsys.readouterr().out
+        assert "Benchmark complete" in out
+        assert (tmp_path / "summary.json").exists()
@@ -0,0 +1,40 @@
+"""Tests for the command-line interface."""
+
+import subprocess
+import sys
+
+
+class TestStartup:
+    def test_heavy_modules_not_imported(self):
+        """Test that importing the CLI doesn't load yaml, pandas or matplotlib."""
+        code = (
+            "import sys, scmextract.cli\n"
+            "loaded = [m for m in ('yaml', 'pandas', 'matplotlib') if m in sys.modules]\n"
+            "if loaded:\n"
+            "    sys.exit(', '.join(loaded))\n"
+        )
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True)
+
+        assert result.returncode == 0, f"loaded: {result.stderr.strip()}"
+
+    def test_load_config_still_exported(self):
+        """Test that load_config is still available from scmextract.core."""
+        from scmextract.core import load_config
+        from scmextract.core.config import load_config as config_load_config
+
+        assert load_config is config_load_config
+
+
+class TestExtract:
+    def test_duplicate_variables(self, sir_sim):
+        """Test that a variable given twice with -v appears once in the graph."""
+        from click.testing import CliRunner
+
+        from scmextract.cli import cli
+
+        args = ["extract", str(sir_sim.get_source_path()),
+                "-v", "Infected", "-v", "S_to_I", "-v", "Infected", "--no-cache"]
+        result = CliRunner().invoke(cli, args)
+
+        assert result.exit_code == 0, result.output
+        assert "Variables: ['Infected', 'S_to_I']" in result.output
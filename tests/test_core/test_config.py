@@ -0,0 +1,44 @@
+"""Tests for configuration loading."""
+
+import pytest
+
+from scmextract.core.config import load_config, parse_config, save_config
+
+
+class TestParseConfig:
+    def test_defaults(self):
+        """Test that optional fields fall back to their defaults."""
+        config = parse_config({"name": "exp", "simulator": "sir", "extractor": "ast"})
+
+        assert config.name == "exp"
+        assert config.variables is None
+        assert config.output_dir == "results"
+        assert config.options == {}
+
+    def test_missing_fields_are_all_reported(self):
+        """Test that every missing required field is named in the error."""
+        with pytest.raises(ValueError, match="simulator, extractor"):
+            parse_config({"name": "exp"})
+
+    def test_non_mapping(self):
+        """Test that an empty document is rejected with ValueError."""
+        with pytest.raises(ValueError, match="mapping"):
+            parse_config(None)
+
+
+class TestLoadConfig:
+    def test_round_trip(self, tmp_path):
+        """Test that a saved config loads back unchanged."""
+        config = parse_config({
+            "name": "exp",
+            "simulator": "sir",
+            "extractor": "ast",
+            "variables": ["Susceptible", "Infected"],
+            "options": {"ignore_loops": True},
+        })
+        path = tmp_path / "exp.yaml"
+        save_config(config, path)
+
+        loaded = load_config(path)
+        assert loaded == config
+        assert loaded.variables == ["Susceptible", "Infected"]
@@ -0,0 +1,71 @@
+"""Tests for file output helpers."""
+
+import gzip
+import json
+from pathlib import Path
+
+from scmextract.core.io import dump_json, ensure_dir
+
+
+class TestDumpJson:
+    def test_round_trip(self, tmp_path):
+        """Test that written JSON loads back unchanged."""
+        data = {"b": [1, 2.5], "a": {"edges": [("x", "y")]}, "flag": True}
+        path = tmp_path / "out.json"
+        dump_json(data, path)
+
+        with open(path) as f:
+            loaded = json.load(f)
+        assert loaded == {"b": [1, 2.5], "a": {"edges": [["x", "y"]]}, "flag": True}
+        assert list(loaded) == ["b", "a", "flag"]
+
+    def test_non_string_keys(self, tmp_path):
+        """Test that objects orjson rejects still get written."""
+        path = tmp_path / "out.json"
+        dump_json({1: "one"}, path)
+
+        with open(path) as f:
+            assert json.load(f) == {"1": "one"}
+
+    def test_gzip_suffix(self, tmp_path):
+        """Test that .gz paths are written as compact gzip-compressed JSON."""
+        data = {"results": [{"f1": 1.0, "shd": 0}]}
+        path = tmp_path / "summary.json.gz"
+        dump_json(data, path)
+
+        with gzip.open(path, "rt") as f:
+            text = f.read()
+        assert json.loads(text) == data
+        assert "\n" not in text
+
+
+class TestEnsureDir:
+    def test_creates_nested_directories(self, tmp_path):
+        """Test that missing parents are created."""
+        path = ensure_dir(tmp_path / "a" / "b" / "c", set())
+
+        assert path.is_dir()
+        assert (tmp_path / "a" / "b").is_dir()
+
+    def test_repeat_calls_skip_filesystem(self, tmp_path, monkeypatch):
+        """Test that an already ensured directory isn't created again."""
+        path = tmp_path / "out" / "sir"
+        created = set()
+        ensure_dir(path, created)
+
+        calls = []
+        monkeypatch.setattr(Path, "mkdir", lambda self, *a, **kw: calls.append(self))
+        ensure_dir(path, created)
+        ensure_dir(tmp_path / "out", created)
+
+        assert calls == []
+
+    def test_new_set_recreates_deleted_directory(self, tmp_path):
+        """Test that a fresh set doesn't trust directories recorded elsewhere."""
+        import shutil
+
+        path = tmp_path / "out"
+        ensure_dir(path, set())
+        shutil.rmtree(path)
+
+        assert ensure_dir(path, set()).is_dir()
@@ -0,0 +1,91 @@
+"""Tests for core data types."""
+
+import numpy as np
+import pytest
+
+from scmextract.core.types import CausalGraph
+
+
+class TestAdjacencyDtype:
+    def test_integer_matrix_is_converted(self):
+        """Integer 0/1 matrices should be stored as booleans."""
+        adj = np.array([[0, 1], [0, 0]], dtype=np.int8)
+        graph = CausalGraph(variables=["A", "B"], adjacency_matrix=adj)
+
+        assert graph.adjacency_matrix.dtype == np.bool_
+        assert graph.get_edges() == [("A", "B")]
+
+    def test_from_dependencies_is_boolean(self):
+        """Graphs built from dependencies should use a boolean matrix."""
+        graph = CausalGraph.from_dependencies({"B": ["A"]})
+
+        assert graph.adjacency_matrix.dtype == np.bool_
+
+
+class TestEdgeSet:
+    def test_edge_set_matches_edges(self, simple_graph):
+        """edge_set should contain exactly the edges from get_edges."""
+        assert simple_graph.edge_set() == frozenset(simple_graph.get_edges())
+        assert len(simple_graph.edge_set()) == simple_graph.num_edges()
+
+    def test_edge_set_is_cached(self, simple_graph):
+        """Repeated calls should return the same frozenset."""
+        assert simple_graph.edge_set() is simple_graph.edge_set()
+
+
+class TestPackedAdjacency:
+    def test_bit_count_matches_edges(self):
+        """The packed bitmap should hold one set bit per edge."""
+        rng = np.random.default_rng(0)
+        n = 70  # 4900 cells, not a multiple of 64
+        adj = (rng.random((n, n)) < 0.1).astype(np.int8)
+        graph = CausalGraph(variables=[f"v{i}" for i in range(n)], adjacency_matrix=adj)
+
+        packed = graph.packed_adjacency()
+        assert packed.dtype == np.uint64
+        assert packed.size == -(-n * n // 64)
+        assert int(np.unpackbits(packed.view(np.uint8)).sum()) == graph.num_edges()
+        assert packed is graph.packed_adjacency()
+
+
+class TestIterEdgesIndexed:
+    def test_indices_match_edges(self, simple_graph):
+        """Indexed edges should name the same edges as get_edges, in order."""
+        variables = simple_graph.variables
+        named = [(variables[i], variables[j]) for i, j in simple_graph.iter_edges_indexed()]
+
+        assert named == simple_graph.get_edges()
+
+
+class TestImmutability:
+    def test_adjacency_is_read_only(self, simple_graph):
+        """The graph's matrix can't be modified, so cached edges stay valid."""
+        with pytest.raises(ValueError):
+            simple_graph.adjacency_matrix[0, 0] = True
+
+    def test_caller_array_changes_are_not_seen(self):
+        """Modifying the caller's array afterwards shouldn't change the graph."""
+        adj = np.zeros((2, 2), dtype=np.bool_)
+        graph = CausalGraph(variables=["A", "B"], adjacency_matrix=adj)
+
+        adj[0, 1] = True
+
+        assert graph.get_edges() == []
+        assert graph.num_edges() == 0
+        assert not graph.adjacency_matrix.any()
+
+    def test_dependencies_are_copies(self, simple_graph):
+        """Modifying returned dependencies shouldn't affect the graph."""
+        deps = simple_graph.to_dependencies()
+        child = next(iter(deps))
+        deps[child].append("extra")
+
+        assert "extra" not in simple_graph.to_dependencies()[child]
+
+    def test_dependencies_mapping_is_read_only(self, simple_graph):
+        """The cached dependencies mapping can't be modified."""
+        deps = simple_graph.dependencies
+
+        assert deps == {"B": ("A",), "C": ("B",)}
+        with pytest.raises(TypeError):
+            deps["A"] = ("C",)
@@ -0,0 +1,22 @@
+"""Graphs shared by the evaluation tests.
+
+CausalGraph is immutable, so each graph is built once per module.
+"""
+
+import pytest
+
+from scmextract.core.types import CausalGraph
+
+VARIABLES = ["A", "B", "C"]
+
+
+@pytest.fixture(scope="module")
+def graph_ab_ac():
+    """A -> B, A -> C"""
+    return CausalGraph.from_dependencies({"B": ["A"], "C": ["A"]}, VARIABLES)
+
+
+@pytest.fixture(scope="module")
+def graph_ab_bc():
+    """A -> B, B -> C"""
+    return CausalGraph.from_dependencies({"B": ["A"], "C": ["B"]}, VARIABLES)
@@ -13,52 +13,38 @@ from scmextract.evaluation.metrics import (
 )
 
 
+# Graphs over A, B, C as dependency dicts
+CHAIN = {"B": ["A"], "C": ["B"]}  # A -> B -> C
+EMPTY = {}
+
+
+def _graph(dependencies):
+    """Build a graph over A, B, C from a dependency dict."""
+    return CausalGraph.from_dependencies(dependencies, ["A", "B", "C"])
+
+
 class TestPrecision:
-    def test_perfect_prediction(self, simple_graph):
-        """Precision should be 1.0 when prediction matches ground truth."""
-        assert precision(simple_graph, simple_graph) == 1.0
-
-    def test_no_correct_edges(self):
-        """Precision should be 0.0 when no predicted edges are correct."""
-        # Predicted: A -> B
-        pred = CausalGraph.from_dependencies({"B": ["A"]}, ["A", "B", "C"])
-        # Truth: B -> C
-        truth = CausalGraph.from_dependencies({"C": ["B"]}, ["A", "B", "C"])
-        assert precision(pred, truth) == 0.0
-
-    def test_partial_correct(self):
-        """Precision with some correct edges."""
-        # Predicted: A -> B, A -> C (2 edges)
-        pred = CausalGraph.from_dependencies({"B": ["A"], "C": ["A"]}, ["A", "B", "C"])
-        # Truth: A -> B only (1 edge)
-        truth = CausalGraph.from_dependencies({"B": ["A"]}, ["A", "B", "C"])
-        assert precision(pred, truth) == 0.5
-
-    def test_empty_prediction_empty_truth(self, empty_graph):
-        """Precision should be 1.0 when both are empty."""
-        assert precision(empty_graph, empty_graph) == 1.0
-
-    def test_empty_prediction_nonempty_truth(self, empty_graph, simple_graph):
-        """Precision should be 0.0 when predicting nothing but truth has edges."""
-        assert precision(empty_graph, simple_graph) == 0.0
+    @pytest.mark.parametrize("pred_deps, truth_deps, expected", [
+        pytest.param(CHAIN, CHAIN, 1.0, id="perfect"),
+        pytest.param({"B": ["A"]}, {"C": ["B"]}, 0.0, id="no-correct-edges"),
+        pytest.param({"B": ["A"], "C": ["A"]}, {"B": ["A"]}, 0.5, id="partial"),
+        pytest.param(EMPTY, EMPTY, 1.0, id="both-empty"),
+        pytest.param(EMPTY, CHAIN, 0.0, id="empty-prediction"),
+    ])
+    def test_precision(self, pred_deps, truth_deps, expected):
+        """Precision = correct edges / predicted edges, 1.0 if both graphs are empty."""
+        assert precision(_graph(pred_deps), _graph(truth_deps)) == expected
 
 
 class TestRecall:
-    def test_perfect_prediction(self, simple_graph):
-        """Recall should be 1.0 when prediction matches ground truth."""
-        assert recall(simple_graph, simple_graph) == 1.0
-
-    def test_missing_edges(self):
-        """Recall with missing edges."""
-        # Predicted: A -> B only
-        pred = CausalGraph.from_dependencies({"B": ["A"]}, ["A", "B", "C"])
-        # Truth: A -> B, B -> C (2 edges)
-        truth = CausalGraph.from_dependencies({"B": ["A"], "C": ["B"]}, ["A", "B", "C"])
-        assert recall(pred, truth) == 0.5
-
-    def test_empty_truth(self, simple_graph, empty_graph):
-        """Recall should be 0.0 when truth is empty but prediction is not."""
-        assert recall(simple_graph, empty_graph) == 0.0
+    @pytest.mark.parametrize("pred_deps, truth_deps, expected", [
+        pytest.param(CHAIN, CHAIN, 1.0, id="perfect"),
+        pytest.param({"B": ["A"]}, CHAIN, 0.5, id="missing-edges"),
+        pytest.param(CHAIN, EMPTY, 0.0, id="empty-truth"),
+    ])
+    def test_recall(self, pred_deps, truth_deps, expected):
+        """Recall = correct edges / true edges, 1.0 if both graphs are empty."""
+        assert recall(_graph(pred_deps), _graph(truth_deps)) == expected
 
 
 class TestF1Score:
@@ -70,48 +56,29 @@ class TestF1Score:
         """F1 should be 0.0 when both precision and recall are 0."""
         assert f1_score(empty_graph, simple_graph) == 0.0
 
-    def test_f1_calculation(self):
+    def test_f1_calculation(self, graph_ab_ac, graph_ab_bc):
         """Test F1 = 2 * P * R / (P + R)."""
-        # Predicted: A -> B, A -> C (2 edges, 1 correct)
-        pred = CausalGraph.from_dependencies({"B": ["A"], "C": ["A"]}, ["A", "B", "C"])
-        # Truth: A -> B, B -> C (2 edges)
-        truth = CausalGraph.from_dependencies({"B": ["A"], "C": ["B"]}, ["A", "B", "C"])
+        result = evaluate_graph(graph_ab_ac, graph_ab_bc)
 
-        p = precision(pred, truth)  # 1/2 = 0.5
-        r = recall(pred, truth)     # 1/2 = 0.5
+        p = result["precision"]  # 1/2 = 0.5
+        r = result["recall"]     # 1/2 = 0.5
         expected_f1 = 2 * p * r / (p + r)  # 0.5
 
-        assert f1_score(pred, truth) == pytest.approx(expected_f1)
+        assert result["f1"] == pytest.approx(expected_f1)
+        assert f1_score(graph_ab_ac, graph_ab_bc) == result["f1"]
 
 
 class TestStructuralHammingDistance:
-    def test_identical_graphs(self, simple_graph):
-        """SHD should be 0 for identical graphs."""
-        assert structural_hamming_distance(simple_graph, simple_graph) == 0
-
-    def test_one_extra_edge(self, simple_graph):
-        """SHD should be 1 for one extra edge."""
-        # Add one edge to simple_graph
-        pred = CausalGraph.from_dependencies(
-            {"B": ["A"], "C": ["B", "A"]},  # Extra A -> C
-            ["A", "B", "C"]
-        )
-        assert structural_hamming_distance(pred, simple_graph) == 1
-
-    def test_one_missing_edge(self, simple_graph):
-        """SHD should be 1 for one missing edge."""
-        # Remove one edge
-        pred = CausalGraph.from_dependencies({"B": ["A"]}, ["A", "B", "C"])
-        assert structural_hamming_distance(pred, simple_graph) == 1
-
-    def test_completely_different(self):
-        """SHD for completely different graphs."""
-        # Pred: A -> B
-        pred = CausalGraph.from_dependencies({"B": ["A"]}, ["A", "B", "C"])
-        # Truth: B -> C
-        truth = CausalGraph.from_dependencies({"C": ["B"]}, ["A", "B", "C"])
-        # 1 FP (A->B) + 1 FN (B->C) = 2
-        assert structural_hamming_distance(pred, truth) == 2
+    @pytest.mark.parametrize("pred_deps, truth_deps, expected", [
+        pytest.param(CHAIN, CHAIN, 0, id="identical"),
+        pytest.param({"B": ["A"], "C": ["B", "A"]}, CHAIN, 1, id="one-extra-edge"),
+        pytest.param({"B": ["A"]}, CHAIN, 1, id="one-missing-edge"),
+        # 1 FP (A->B) + 1 FN (B->C)
+        pytest.param({"B": ["A"]}, {"C": ["B"]}, 2, id="completely-different"),
+    ])
+    def test_shd(self, pred_deps, truth_deps, expected):
+        """SHD counts extra plus missing edges."""
+        assert structural_hamming_distance(_graph(pred_deps), _graph(truth_deps)) == expected
 
 
 class TestEvaluateGraph:
@@ -128,3 +95,95 @@ class TestEvaluateGraph:
         assert result["recall"] == 1.0
         assert result["f1"] == 1.0
         assert result["shd"] == 0
+
+    def test_matches_individual_metrics(self, graph_ab_ac, graph_ab_bc):
+        """evaluate_graph should agree with the individual metric functions."""
+        pred, truth = graph_ab_ac, graph_ab_bc
+        result = evaluate_graph(pred, truth)
+
+        assert result["precision"] == precision(pred, truth)
+        assert result["recall"] == recall(pred, truth)
+        assert result["f1"] == f1_score(pred, truth)
+        assert result["shd"] == structural_hamming_distance(pred, truth)
+
+    def test_counts_edges_once(self, simple_graph, monkeypatch):
+        """evaluate_graph should compare the two graphs only once."""
+        from scmextract.evaluation import metrics
+
+        calls = []
+        confusion = metrics._confusion
+        monkeypatch.setattr(metrics, "_confusion",
+                            lambda *args: calls.append(args) or confusion(*args))
+        evaluate_graph(simple_graph, simple_graph)
+
+        assert len(calls) == 1
+
+
+class TestVariableOrder:
+    def test_reordered_variables(self):
+        """Metrics should not depend on the variable order of either graph."""
+        deps = {"B": ["A"], "C": ["A", "B"]}
+        pred = CausalGraph.from_dependencies(deps, ["A", "B", "C"])
+        truth = CausalGraph.from_dependencies(deps, ["C", "A", "B"])
+        result = evaluate_graph(pred, truth)
+
+        assert result["f1"] == 1.0
+        assert result["shd"] == 0
+        assert structural_hamming_distance(pred, truth) == 0
+
+    def test_different_variables(self):
+        """Graphs over different variables should be compared by edge."""
+        pred = CausalGraph.from_dependencies({"B": ["A"], "D": ["A"]}, ["A", "B", "D"])
+        truth = CausalGraph.from_dependencies({"B": ["A"], "C": ["B"]}, ["A", "B", "C"])
+        result = evaluate_graph(pred, truth)
+
+        assert result["precision"] == 0.5
+        assert result["recall"] == 0.5
+        assert result["shd"] == 2
+        assert structural_hamming_distance(pred, truth) == 2
+
+
+class TestLargeGraphs:
+    def test_packed_path_matches_edge_sets(self):
+        """Large graphs compared on packed bitmaps should match the edge-set counts."""
+        rng = np.random.default_rng(0)
+        n = 250
+        variables = [f"v{i}" for i in range(n)]
+        pred = CausalGraph(variables, (rng.random((n, n)) < 0.05).astype(np.int8))
+        truth = CausalGraph(variables, (rng.random((n, n)) < 0.05).astype(np.int8))
+
+        pred_edges, true_edges = pred.edge_set(), truth.edge_set()
+        result = evaluate_graph(pred, truth)
+
+        assert result["precision"] == len(pred_edges & true_edges) / len(pred_edges)
+        assert result["recall"] == len(pred_edges & true_edges) / len(true_edges)
+        assert result["shd"] == len(pred_edges ^ true_edges)
+        assert structural_hamming_distance(pred, truth) == result["shd"]
+
+
+class TestEvaluateGraphsBatch:
+    def test_matches_evaluate_graph(self, simple_graph, empty_graph, graph_ab_ac):
+        """Each row should equal evaluate_graph for that prediction."""
+        from scmextract.evaluation import evaluate_graphs_batch
+
+        variables = simple_graph.variables
+        predictions = [
+            simple_graph,
+            empty_graph,
+            graph_ab_ac,
+            # Same variables in another order, and different variables
+            CausalGraph.from_dependencies(simple_graph.to_dependencies(), list(reversed(variables))),
+            CausalGraph.from_dependencies({"B": ["A"], "D": ["A"]}, ["A", "B", "D"]),
+        ]
+        df = evaluate_graphs_batch(predictions, simple_graph)
+
+        assert list(df.columns) == ["precision", "recall", "f1", "shd"]
+        assert len(df) == len(predictions)
+        for row, pred in zip(df.to_dict("records"), predictions):
+            assert row == pytest.approx(evaluate_graph(pred, simple_graph))
+
+    def test_empty_batch(self, simple_graph):
+        """An empty batch should give an empty frame."""
+        from scmextract.evaluation import evaluate_graphs_batch
+
+        assert len(evaluate_graphs_batch([], simple_graph)) == 0
@@ -3,18 +3,16 @@
 import pytest
 
 from scmextract.extractors.ast_extractor import ASTExtractor
-from scmextract.simulators.sir import SIRSimulator
 
 
 class TestASTExtractor:
-    def test_extract_simple_assignment(self):
+    def test_extract_simple_assignment(self, ast_extractor):
         """Test extraction from simple variable assignment."""
         code = """
 x = a + b
 y = x * c
 """
-        extractor = ASTExtractor()
-        graph = extractor.extract_from_string(code, variables={"x", "y", "a", "b", "c"})
+        graph = ast_extractor.extract_from_string(code, variables={"x", "y", "a", "b", "c"})
         deps = graph.to_dependencies()
 
         assert "x" in deps
@@ -23,15 +21,14 @@ y = x * c
         assert "y" in deps
         assert set(deps["y"]) == {"x", "c"}
 
-    def test_extract_with_filter(self):
+    def test_extract_with_filter(self, ast_extractor):
         """Test that variable filter works."""
         code = """
 x = a + b + noise
 y = x * c
 """
-        extractor = ASTExtractor()
         # Only care about x, y, a, b - not noise or c
-        graph = extractor.extract_from_string(code, variables={"x", "y", "a", "b"})
+        graph = ast_extractor.extract_from_string(code, variables={"x", "y", "a", "b"})
         deps = graph.to_dependencies()
 
         assert "x" in deps
@@ -40,38 +37,84 @@ y = x * c
         assert "y" in deps
         assert set(deps["y"]) == {"x"}  # c filtered out
 
-    def test_extract_list_append(self):
+    def test_extract_list_append(self, ast_extractor):
         """Test extraction from list.append() calls."""
         code = """
 values = []
 values.append(x + y)
 """
-        extractor = ASTExtractor()
-        graph = extractor.extract_from_string(code, variables={"values", "x", "y"})
+        graph = ast_extractor.extract_from_string(code, variables={"values", "x", "y"})
         deps = graph.to_dependencies()
 
         assert "values" in deps
         assert set(deps["values"]) == {"x", "y"}
 
-    def test_extract_attribute_assignment(self):
+    def test_variable_order(self, ast_extractor):
+        """Test that a variable sequence keeps its order and a set is sorted."""
+        code = "x = a + b\n"
+
+        assert ast_extractor.extract_from_string(code, variables=["x", "b", "a"]).variables == ["x", "b", "a"]
+        assert ast_extractor.extract_from_string(code, variables={"x", "b", "a"}).variables == ["a", "b", "x"]
+
+    def test_duplicate_variables(self, ast_extractor):
+        """Test that repeated names in a variable sequence give one node each."""
+        graph = ast_extractor.extract_from_string("x = a + b\n", variables=["x", "a", "x", "b"])
+
+        assert graph.variables == ["x", "a", "b"]
+        assert graph.to_dependencies() == {"x": ["a", "b"]}
+
+    def test_append_inside_untracked_assignment(self, ast_extractor):
+        """Test that mutations nested in an ignored assignment are still found."""
+        code = """
+ignored = log(history.append(x + noise))
+"""
+        graph = ast_extractor.extract_from_string(code, variables={"history", "x"})
+        deps = graph.to_dependencies()
+
+        assert set(deps["history"]) == {"x"}
+
+    def test_extract_attribute_assignment(self, ast_extractor):
         """Test extraction from attribute assignment."""
         code = """
 self.result = input_a + input_b
 """
-        extractor = ASTExtractor()
-        graph = extractor.extract_from_string(code, variables={"result", "input_a", "input_b"})
+        graph = ast_extractor.extract_from_string(code, variables={"result", "input_a", "input_b"})
         deps = graph.to_dependencies()
 
         assert "result" in deps
         assert set(deps["result"]) == {"input_a", "input_b"}
 
-    def test_self_loops_included_by_default(self):
+    def test_extract_subscript_assignment(self, ast_extractor):
+        """Test that item assignment is attributed to the indexed container."""
+        code = """
+x[t] = x[t - 1] + rate
+self.y[t] = x[t]
+"""
+        graph = ast_extractor.extract_from_string(code, variables={"x", "y", "rate"})
+        deps = graph.to_dependencies()
+
+        assert set(deps["x"]) == {"x", "rate"}
+        assert set(deps["y"]) == {"x"}
+
+    def test_parse_is_reused(self, ast_extractor):
+        """Test that extracting from the same source twice parses it once."""
+        from scmextract.extractors.ast_extractor import _parse_cached
+
+        code = "x = a + b\ny = x * c\n"
+        first = ast_extractor.extract_from_string(code, variables={"x", "a", "b"})
+        misses = _parse_cached.cache_info().misses
+        second = ast_extractor.extract_from_string(code, variables={"y", "x", "c"})
+
+        assert _parse_cached.cache_info().misses == misses
+        assert set(first.to_dependencies()["x"]) == {"a", "b"}
+        assert set(second.to_dependencies()["y"]) == {"x", "c"}
+
+    def test_self_loops_included_by_default(self, ast_extractor):
         """Test that self-loops are included by default."""
         code = """
 x = x + 1
 """
-        extractor = ASTExtractor()
-        graph = extractor.extract_from_string(code, variables={"x"})
+        graph = ast_extractor.extract_from_string(code, variables={"x"})
         deps = graph.to_dependencies()
 
         # x = x + 1 should create x -> x edge
@@ -90,15 +133,9 @@ x = x + 1
         # x = x + 1 should not create x -> x edge when disabled
         assert "x" not in deps or "x" not in deps.get("x", [])
 
-    def test_extract_from_sir_simulator(self):
+    def test_extract_from_sir_simulator(self, sir_extracted_graph):
         """Test extraction from actual SIR simulator code."""
-        sim = SIRSimulator()
-        extractor = ASTExtractor()
-
-        variables = set(sim.get_all_variables())
-        graph = extractor.extract(sim.get_source_path(), variables=variables)
-
-        deps = graph.to_dependencies()
+        deps = sir_extracted_graph.to_dependencies()
 
         # Should find S_to_I depends on rateSI, Susceptible, Infected
         assert "S_to_I" in deps
@@ -109,6 +146,29 @@ x = x + 1
         assert "Susceptible" in deps
         assert "S_to_I" in deps["Susceptible"]
 
+    def test_extract_with_context(self, sir_sim, ast_extractor, sir_extracted_graph):
+        """Test that a shared ExtractionContext gives the same graph."""
+        from scmextract.core.context import ExtractionContext
+
+        variables = tuple(sir_sim.get_all_variables())
+        context = ExtractionContext.from_path(sir_sim.get_source_path())
+        graph = ast_extractor.extract(sir_sim.get_source_path(), variables=variables, context=context)
+
+        assert graph == sir_extracted_graph
+
+    def test_context_tree_is_used(self, tmp_path, ast_extractor):
+        """Test that the context's parsed tree is used instead of the file."""
+        import ast
+
+        from scmextract.core.context import ExtractionContext
+
+        source = tmp_path / "model.py"
+        source.write_text("x = a\n")
+        context = ExtractionContext(source, b"x = b\n", ast.parse("x = b\n"))
+
+        graph = ast_extractor.extract(source, variables={"x", "a", "b"}, context=context)
+        assert graph.to_dependencies() == {"x": ["b"]}
+
 
 class TestASTExtractorRegistry:
     def test_registered_as_ast(self):
@@ -124,3 +184,117 @@ class TestASTExtractorRegistry:
 
         extractor = get_extractor("ast")
         assert isinstance(extractor, ASTExtractor)
+        assert get_extractor("ast") is extractor
+
+    def test_reregistering_replaces_cached_instance(self):
+        """Test get_extractor returns the newly registered class after re-registration."""
+        from scmextract.extractors import get_extractor
+        from scmextract.extractors.registry import ExtractorRegistry
+
+        class CustomASTExtractor(ASTExtractor):
+            pass
+
+        get_extractor("ast")
+        try:
+            ExtractorRegistry.register("ast")(CustomASTExtractor)
+            assert isinstance(get_extractor("ast"), CustomASTExtractor)
+        finally:
+            ExtractorRegistry.register("ast")(ASTExtractor)
+
+        assert type(get_extractor("ast")) is ASTExtractor
+
+    def test_list_extractors_is_read_only(self):
+        """Test that the listing can't be used to modify the registry."""
+        from scmextract.extractors.registry import ExtractorRegistry
+
+        extractors = ExtractorRegistry.list_extractors()
+        assert extractors["ast"] is ASTExtractor
+        with pytest.raises(TypeError):
+            extractors["other"] = ASTExtractor
+
+
+class TestCachedExtract:
+    def test_cache_hit_matches_extract(self, tmp_path, ast_extractor):
+        """Test that a cached result equals a fresh extraction."""
+        source = tmp_path / "model.py"
+        source.write_text("x = a + b\n")
+        cache_dir = tmp_path / "cache"
+
+        first = ast_extractor.cached_extract(source, variables={"x", "a", "b"}, cache_dir=cache_dir)
+        assert len(list(cache_dir.glob("*.pkl"))) == 1
+
+        second = ast_extractor.cached_extract(source, variables={"x", "a", "b"}, cache_dir=cache_dir)
+        assert second == first
+        assert second == ast_extractor.extract(source, variables={"x", "a", "b"})
+
+    def test_variable_order_is_part_of_key(self, tmp_path, ast_extractor):
+        """Test that sequences in different orders are cached separately."""
+        source = tmp_path / "model.py"
+        source.write_text("x = a + b\n")
+        cache_dir = tmp_path / "cache"
+
+        first = ast_extractor.cached_extract(source, variables=["x", "a", "b"], cache_dir=cache_dir)
+        second = ast_extractor.cached_extract(source, variables=["a", "b", "x"], cache_dir=cache_dir)
+
+        assert first.variables == ["x", "a", "b"]
+        assert second.variables == ["a", "b", "x"]
+
+    def test_source_change_invalidates(self, tmp_path, ast_extractor):
+        """Test that editing the source file produces a new result."""
+        source = tmp_path / "model.py"
+        source.write_text("x = a\n")
+        cache_dir = tmp_path / "cache"
+
+        before = ast_extractor.cached_extract(source, variables={"x", "a", "b"}, cache_dir=cache_dir)
+        source.write_text("x = b\n")
+        after = ast_extractor.cached_extract(source, variables={"x", "a", "b"}, cache_dir=cache_dir)
+
+        assert before.to_dependencies() == {"x": ["a"]}
+        assert after.to_dependencies() == {"x": ["b"]}
+
+    def test_extractor_source_is_part_of_key(self, tmp_path, monkeypatch):
+        """Test that editing an extractor's module invalidates its cached results."""
+        import importlib
+        import sys
+
+        header = (
+            "from scmextract.core.types import CausalGraph\n"
+            "from scmextract.extractors.ast_extractor import ASTExtractor\n"
+            "class EditedExtractor(ASTExtractor):\n"
+            "    def extract(self, source_path, variables=None, context=None):\n"
+            "        graph = super().extract(source_path, variables, context)\n"
+        )
+        module_path = tmp_path / "edited_extractor.py"
+        source = tmp_path / "model.py"
+        source.write_text("x = a + b\n")
+        cache_dir = tmp_path / "cache"
+        monkeypatch.syspath_prepend(str(tmp_path))
+        monkeypatch.delitem(sys.modules, "edited_extractor", raising=False)
+
+        module_path.write_text(header + "        return graph\n")
+        first = importlib.import_module("edited_extractor").EditedExtractor()
+        before = first.cached_extract(source, variables=["x", "a", "b"], cache_dir=cache_dir)
+
+        # Same class name, VERSION and options; only the module source changes
+        module_path.write_text(
+            header + "        return CausalGraph(graph.variables, graph.adjacency_matrix.T)\n")
+        del sys.modules["edited_extractor"]
+        second = importlib.import_module("edited_extractor").EditedExtractor()
+        after = second.cached_extract(source, variables=["x", "a", "b"], cache_dir=cache_dir)
+
+        assert before.to_dependencies() == {"x": ["a", "b"]}
+        assert after.to_dependencies() == {"a": ["x"], "b": ["x"]}
+
+    def test_configuration_is_part_of_key(self, tmp_path, ast_extractor):
+        """Test that extractors with different options don't share entries."""
+        source = tmp_path / "model.py"
+        source.write_text("x = x + 1\n")
+        cache_dir = tmp_path / "cache"
+
+        with_loops = ast_extractor.cached_extract(source, variables={"x"}, cache_dir=cache_dir)
+        without_loops = ASTExtractor(include_self_loops=False).cached_extract(
+            source, variables={"x"}, cache_dir=cache_dir
+        )
+
+        assert with_loops.num_edges() == 1
+        assert without_loops.num_edges() == 0
@@ -0,0 +1,9 @@
+"""Fixtures for the simulator tests."""
+
+import pytest
+
+
+@pytest.fixture(scope="session", autouse=True)
+def warm_sir_kernel(sir_sim):
+    """Compile (or load the cached) SIR kernel before the first test times it."""
+    sir_sim.run(steps=2)
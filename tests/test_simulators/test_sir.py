@@ -1,18 +1,24 @@
 """Tests for SIR simulator."""
 
+import numpy as np
 import pytest
 
 from scmextract.simulators.sir import SIRSimulator
 
 
+@pytest.fixture(scope="module")
+def sir_run(sir_sim):
+    """A short default simulation, run once for the tests that only read it."""
+    return sir_sim.run(steps=20)
+
+
 class TestSIRSimulator:
-    def test_initialization(self):
+    def test_initialization(self, sir_sim):
         """Test default initialization."""
-        sim = SIRSimulator()
-        assert sim.initial_susceptible == 950
-        assert sim.initial_infected == 50
-        assert sim.initial_resistant == 0
-        assert sim.population == 1000
+        assert sir_sim.initial_susceptible == 950
+        assert sir_sim.initial_infected == 50
+        assert sir_sim.initial_resistant == 0
+        assert sir_sim.population == 1000
 
     def test_custom_initialization(self):
         """Test custom parameters."""
@@ -30,38 +36,58 @@ class TestSIRSimulator:
         assert sim.rate_si == 0.1
         assert sim.rate_ir == 0.05
 
-    def test_run_returns_dataframe(self):
+    def test_run_returns_dataframe(self, sir_run):
         """Test that run returns a DataFrame with correct columns."""
-        sim = SIRSimulator()
-        results = sim.run(steps=100)
+        results = sir_run
 
-        assert len(results) == 100
+        assert len(results) == 20
         assert "Time" in results.columns
         assert "Susceptible" in results.columns
         assert "Infected" in results.columns
         assert "Resistant" in results.columns
 
-    def test_population_conserved(self):
+    def test_population_conserved(self, sir_run):
         """Test that total population is conserved."""
-        sim = SIRSimulator()
-        results = sim.run(steps=100)
+        total = sir_run[["Susceptible", "Infected", "Resistant"]].to_numpy().sum(axis=1)
+        assert np.max(np.abs(total - 1000)) < 1e-10
+
+    def test_interpreted_matches_compiled(self, sir_sim, monkeypatch):
+        """Test that the list-based fallback gives the same trajectory."""
+        from scmextract.simulators import sir
+
+        results = sir_sim.run(steps=100)
+
+        monkeypatch.setattr(sir, "_compiled_simulate", lambda: None)
+        fallback = sir_sim.run(steps=100)
+
+        assert results.equals(fallback)
 
-        total = results["Susceptible"] + results["Infected"] + results["Resistant"]
-        assert all(abs(total - 1000) < 1e-10)
+    def test_numba_not_imported_on_load(self):
+        """Test that importing the simulator doesn't import numba."""
+        import subprocess
+        import sys
 
-    def test_get_state_variables(self):
+        code = "import sys, scmextract.simulators.sir; sys.exit('numba' in sys.modules)"
+        assert subprocess.run([sys.executable, "-c", code]).returncode == 0
+
+    def test_single_step(self, sir_sim):
+        """Test that the initial state is returned even for zero steps."""
+        results = sir_sim.run(steps=0)
+
+        assert len(results) == 1
+        assert results["Susceptible"][0] == 950
+
+    def test_get_state_variables(self, sir_sim):
         """Test get_state_variables returns S, I, R."""
-        sim = SIRSimulator()
-        vars = sim.get_state_variables()
+        vars = set(sir_sim.get_state_variables())
 
         assert "Susceptible" in vars
         assert "Infected" in vars
         assert "Resistant" in vars
 
-    def test_get_all_variables(self):
+    def test_get_all_variables(self, sir_sim):
         """Test get_all_variables includes parameters and intermediates."""
-        sim = SIRSimulator()
-        vars = sim.get_all_variables()
+        vars = set(sir_sim.get_all_variables())
 
         # State variables
         assert "Susceptible" in vars
@@ -76,10 +102,13 @@ class TestSIRSimulator:
         assert "rateSI" in vars
         assert "rateIR" in vars
 
-    def test_get_ground_truth_graph(self):
+    def test_variable_order_matches_ground_truth(self, sir_sim):
+        """Test that get_all_variables lists variables in ground truth order."""
+        assert sir_sim.get_all_variables() == sir_sim.get_ground_truth_graph().variables
+
+    def test_get_ground_truth_graph(self, sir_sim):
         """Test ground truth graph structure."""
-        sim = SIRSimulator()
-        graph = sim.get_ground_truth_graph()
+        graph = sir_sim.get_ground_truth_graph()
 
         # Check variables
         assert "Susceptible" in graph.variables
@@ -100,11 +129,65 @@ class TestSIRSimulator:
         assert "Infected" in deps["I_to_R"]
         assert "rateIR" in deps["I_to_R"]
 
-    def test_get_source_path(self):
-        """Test that source path points to a valid file."""
-        sim = SIRSimulator()
-        path = sim.get_source_path()
+    def test_ground_truth_is_shared(self, sir_sim):
+        """Test that the ground truth is built once and can't be modified."""
+        graph = sir_sim.get_ground_truth_graph()
+
+        assert SIRSimulator(rate_si=0.2).get_ground_truth_graph().adjacency_matrix is \
+            graph.adjacency_matrix
+        with pytest.raises(ValueError):
+            graph.adjacency_matrix[0, 0] = 1
+
+    def test_ground_truth_metadata_not_shared(self, sir_sim):
+        """Test that changes to one caller's graph don't reach other callers."""
+        graph = sir_sim.get_ground_truth_graph()
+        graph.metadata["note"] = 1
+        graph.variables.append("extra")
+
+        other = SIRSimulator(rate_si=0.3).get_ground_truth_graph()
+        assert other.metadata == {}
+        assert "extra" not in other.variables
+        assert other == sir_sim.get_ground_truth_graph()
+
+    def test_variable_lists_are_copies(self, sir_sim):
+        """Test that callers can't modify the simulator's variable lists."""
+        sir_sim.get_all_variables().append("extra")
+
+        assert "extra" not in sir_sim.get_all_variables()
+
+    def test_get_source_path(self, sir_sim):
+        """Test that source path points to the simulator's module."""
+        path = sir_sim.get_source_path()
 
-        assert path.exists()
         assert path.suffix == ".py"
         assert "sir" in path.name.lower()
+
+    @pytest.mark.integration
+    def test_source_path_exists(self, sir_sim):
+        """Test that the source path exists on disk."""
+        assert sir_sim.get_source_path().is_file()
+
+
+class TestSIRSimulatorRegistry:
+    def test_registered_as_sir(self):
+        """Test simulator is registered with name 'sir'."""
+        from scmextract.simulators.registry import SimulatorRegistry
+
+        assert SimulatorRegistry.get("sir") == SIRSimulator
+
+    def test_get_simulator_reuses_instance(self):
+        """Test get_simulator returns one shared instance per name."""
+        from scmextract.simulators import get_simulator
+
+        simulator = get_simulator("sir")
+        assert isinstance(simulator, SIRSimulator)
+        assert get_simulator("sir") is simulator
+
+    def test_list_simulators_is_read_only(self):
+        """Test that the listing can't be used to modify the registry."""
+        from scmextract.simulators.registry import SimulatorRegistry
+
+        simulators = SimulatorRegistry.list_simulators()
+        assert simulators["sir"] is SIRSimulator
+        with pytest.raises(TypeError):
+            simulators["other"] = SIRSimulator
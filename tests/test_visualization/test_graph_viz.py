@@ -0,0 +1,60 @@
+"""Tests for graph visualization."""
+
+from matplotlib.figure import Figure
+
+from scmextract.visualization.graph_viz import save_graph, to_dot, visualize_graph
+
+
+class TestVisualizeGraph:
+    def test_saves_png(self, simple_graph, tmp_path):
+        """Test that a visualization is written to the output path."""
+        output = tmp_path / "graph.png"
+        visualize_graph(simple_graph, output_path=str(output))
+
+        assert output.exists()
+        assert output.stat().st_size > 0
+
+    def test_reuses_given_axes(self, simple_graph, diamond_graph, tmp_path):
+        """Test drawing repeatedly into the same axes."""
+        ax = Figure().add_subplot()
+
+        visualize_graph(simple_graph, output_path=str(tmp_path / "a.png"), title="A", ax=ax)
+        visualize_graph(diamond_graph, output_path=str(tmp_path / "b.png"), title="B", ax=ax)
+
+        assert ax.get_title() == "B"
+        assert len(ax.figure.axes) == 1
+        assert (tmp_path / "a.png").exists()
+        assert (tmp_path / "b.png").exists()
+
+
+class TestDot:
+    def test_to_dot_lists_edges(self, simple_graph):
+        """Test that every edge appears once in the DOT output."""
+        dot = to_dot(simple_graph, title="Test")
+        lines = dot.splitlines()
+
+        assert lines[0] == 'digraph "Test" {'
+        assert lines[-1] == "}"
+        for parent, child in simple_graph.get_edges():
+            assert f'    "{parent}" -> "{child}";' in lines
+        assert len(lines) == 4 + simple_graph.num_edges()
+
+    def test_saved_dot_matches_to_dot(self, simple_graph, tmp_path):
+        """Test that the streamed file has the same content as to_dot."""
+        path = tmp_path / "graph.dot"
+        save_graph(simple_graph, path, format="dot")
+
+        assert path.read_text() == to_dot(simple_graph)
+
+
+class TestSaveGraph:
+    def test_recreates_deleted_directory(self, simple_graph, tmp_path):
+        """Test that saving again after the output directory was removed works."""
+        import shutil
+
+        output = tmp_path / "out" / "graph.json"
+        save_graph(simple_graph, output)
+        shutil.rmtree(output.parent)
+        save_graph(simple_graph, output)
+
+        assert output.exists()